@@ -10,6 +10,7 @@
 #  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for  #
 #  the specific language governing permissions and limitations under the License.                                     #
 # #####################################################################################################################
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -81,10 +82,10 @@ class ResourceName(Construct):
             properties=properties,
         )
 
-    @property
+    @cached_property
     def resource_name(self):
         return self.resource_name_resource.get_att("Name")
 
-    @property
+    @cached_property
     def resource_id(self):
         return self.resource_name_resource.get_att("Id")
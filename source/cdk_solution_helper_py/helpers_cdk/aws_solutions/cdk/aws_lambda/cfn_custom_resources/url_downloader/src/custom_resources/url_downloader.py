@@ -97,7 +97,15 @@ class Downloader:
                 self.destination_key,
             )
         )
-        dest_bucket.copy(copy_source, self.destination_key)
+        # S3 to S3 copies are performed server-side (UploadPartCopy) - larger parts reduce the number of requests
+        # without increasing the memory used by this function
+        transfer_config = TransferConfig(
+            multipart_threshold=64 * MB,
+            max_concurrency=10,
+            multipart_chunksize=64 * MB,
+            use_threads=True,
+        )
+        dest_bucket.copy(copy_source, self.destination_key, Config=transfer_config)
 
     def copy_from_url(self):
         if not self.source_url:
@@ -16,7 +16,7 @@ from typing import Optional
 import aws_cdk.aws_iam as iam
 from constructs import Construct
 from aws_cdk.aws_s3 import Location, Bucket
-from aws_cdk import CfnResource, Duration, Aws
+from aws_cdk import CfnResource, Duration, Aws, Stack
 from aws_solutions.cdk.aws_lambda.python.function import SolutionsPythonFunction
 
 
@@ -99,13 +99,19 @@ class UrlDownloader(Construct):
         )
 
     def url_builder_function(self):
-        return SolutionsPythonFunction(
-            self,
-            self.name + "Function",
-            entrypoint=Path(__file__).parent
-            / "src"
-            / "custom_resources"
-            / "url_downloader.py",
-            function="handler",
-            timeout=Duration.seconds(300),
-        )
+        stack = Stack.of(self)
+        construct_id = "UrlDownloader-7A6D1B8E-5C1F-4F0B-9D3A-2E8C4B6F1A90"
+        exists = stack.node.try_find_child(construct_id)
+        if exists:
+            return exists
+        else:
+            return SolutionsPythonFunction(
+                stack,
+                construct_id,
+                entrypoint=Path(__file__).parent
+                / "src"
+                / "custom_resources"
+                / "url_downloader.py",
+                function="handler",
+                timeout=Duration.seconds(300),
+            )
@@ -22,6 +22,12 @@ from crhelper import CfnResource
 logger = logging.getLogger(__name__)
 helper = CfnResource(log_level=getenv("LOG_LEVEL", "WARNING"))
 
+S3_URL_MATCHERS = (
+    re.compile(r"^https?://s3[.-](.*).amazonaws.com/(?P<bucket>.*)/(?P<key>.*)$"),
+    re.compile(r"^https?://(?P<bucket>.*).s3[.-](.*).amazonaws.com/(?P<key>.*)$"),
+    re.compile(r"^https?://(?P<bucket>.*).s3.amazonaws.com/(?P<key>.*)$"),
+)
+
 
 def get_property(event, property_name, property_default=None, property_required=True):
     _prop = event.get("ResourceProperties", {}).get(property_name, property_default)
@@ -46,15 +52,9 @@ class UrlHelper:
             self.source_bucket = parse_result.netloc
             self.source_key = parse_result.path.lstrip("/")
         elif self.scheme == "http" or self.scheme == "https":
-            s3_matchers = [
-                r"^https?://s3[.-](.*).amazonaws.com/(?P<bucket>.*)/(?P<key>.*)$",
-                r"^https?://(?P<bucket>.*).s3[.-](.*).amazonaws.com/(?P<key>.*)$",
-                r"^https?://(?P<bucket>.*).s3.amazonaws.com/(?P<key>.*)$",
-            ]
-
             # detect S3 HTTP/ HTTPS URLS
-            for regex in s3_matchers:
-                match = re.search(regex, self.url)
+            for regex in S3_URL_MATCHERS:
+                match = regex.search(self.url)
                 if match:
                     self.scheme = "s3"
                     self.source_bucket = match.group("bucket")
@@ -10,8 +10,9 @@
 #  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for  #
 #  the specific language governing permissions and limitations under the License.                                     #
 # #####################################################################################################################
+from functools import cached_property
 from pathlib import Path
-from typing import Union
+from typing import Dict, Union
 
 from constructs import Construct
 from aws_cdk import (
@@ -27,6 +28,8 @@ from aws_cdk import (
 from aws_solutions.cdk.aspects import ConditionalResources
 from aws_solutions.cdk.aws_lambda.python.function import SolutionsPythonFunction
 
+URL_INFO_ATTRIBUTES = ("Url", "Scheme", "Bucket", "Key")
+
 
 class UrlHelper(Construct):
     def __init__(self, scope: Construct, id: str, url: Union[str, CfnParameter]):
@@ -60,27 +63,15 @@ class UrlHelper(Construct):
         )
         Aspects.of(self.helper).add(ConditionalResources(self.url_provided))
 
-    @property
-    def properties(self):
+    @cached_property
+    def properties(self) -> Dict[str, str]:
         return {
-            f"{self.url_for}Url": Fn.condition_if(
-                self.url_provided.logical_id, self.helper.get_att("Url").to_string(), ""
-            ).to_string(),
-            f"{self.url_for}Scheme": Fn.condition_if(
-                self.url_provided.logical_id,
-                self.helper.get_att("Scheme").to_string(),
-                "",
-            ).to_string(),
-            f"{self.url_for}Bucket": Fn.condition_if(
-                self.url_provided.logical_id,
-                self.helper.get_att("Bucket").to_string(),
-                "",
-            ).to_string(),
-            f"{self.url_for}Key": Fn.condition_if(
+            f"{self.url_for}{attribute}": Fn.condition_if(
                 self.url_provided.logical_id,
-                self.helper.get_att("Key").to_string(),
+                self.helper.get_att(attribute),
                 "",
-            ).to_string(),
+            ).to_string()
+            for attribute in URL_INFO_ATTRIBUTES
         }
 
     def url_helper_function(self):
@@ -91,7 +82,7 @@ class UrlHelper(Construct):
             return exists
         else:
             return SolutionsPythonFunction(
-                self,
+                stack,
                 construct_id,
                 entrypoint=Path(__file__).parent
                 / "src"
@@ -11,11 +11,15 @@
 #  the specific language governing permissions and limitations under the License.                                     #
 # #####################################################################################################################
 
+import hashlib
 import importlib.util
 import logging
 import os
 import platform
 import subprocess
+import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Union
 
@@ -33,6 +37,15 @@ REQUIREMENTS_POETRY_FILE = "pyproject.toml"
 
 logger = logging.getLogger("cdk-helper")
 
+# pip installs are shared between bundles with identical requirements (e.g. the custom resources) for this process
+_pip_install_cache: Dict[str, Path] = {}
+
+
+@lru_cache(maxsize=None)
+def _pip_install_cache_dir() -> tempfile.TemporaryDirectory:
+    """The directory shared pip installs are made in - created on the first local pip install"""
+    return tempfile.TemporaryDirectory(prefix="solutions-pip-")
+
 
 class SolutionsPythonBundlingException(Exception):
     pass
@@ -80,7 +93,7 @@ class SolutionsPythonBundling:
             self._local_bundle_with_pip(output_dir)
         except subprocess.CalledProcessError as cpe:
             raise SolutionsPythonBundlingException(
-                f"local bundling was tried but failed: {cpe}"
+                f"local bundling was tried but failed: {cpe} {cpe.stderr or ''}".rstrip()
             )
 
         return True
@@ -105,24 +118,49 @@ class SolutionsPythonBundling:
 
         cwd = Path(cwd)
 
-        with subprocess.Popen(
-            command,
-            shell=False,
-            stdout=subprocess.PIPE,
-            universal_newlines=True,
-            cwd=cwd,
-            env=env,
-        ) as p:
-            for line in p.stdout:
-                logger.info("%s %s: %s" % (self.to_bundle.name, name, line.rstrip()))
-                if save_file:
-                    save_file.write(line)
-
-        if save_file:
-            save_file.close()
+        # stderr is kept (in a file, so a chatty command cannot block on a full pipe) to explain failures
+        with tempfile.TemporaryFile(mode="w+") as stderr:
+            # when the output is neither logged nor saved, let the command write straight to /dev/null
+            log_output = logger.isEnabledFor(logging.INFO)
+            if not log_output and not save_file:
+                p = subprocess.run(
+                    command,
+                    shell=False,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr,
+                    cwd=cwd,
+                    env=env,
+                )
+            else:
+                with subprocess.Popen(
+                    command,
+                    shell=False,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                    universal_newlines=True,
+                    cwd=cwd,
+                    env=env,
+                ) as p:
+                    for line in p.stdout:
+                        if log_output:
+                            logger.info(
+                                "%s %s: %s", self.to_bundle.name, name, line.rstrip()
+                            )
+                        if save_file:
+                            save_file.write(line)
+
+            if save_file:
+                save_file.close()
+
+            stderr.seek(0)
+            diagnostics = stderr.read()
 
         if p.returncode != 0:
-            raise subprocess.CalledProcessError(p.returncode, p.args)
+            raise subprocess.CalledProcessError(
+                p.returncode, p.args, stderr=diagnostics
+            )
+        if diagnostics:
+            logger.info("%s %s: %s", self.to_bundle.name, name, diagnostics.rstrip())
 
     def validate_requirements_file(self, output_dir):
         requirements_file = Path(output_dir) / REQUIREMENTS_TXT_FILE
@@ -157,15 +195,49 @@ class SolutionsPythonBundling:
         self.validate_requirements_file(output_dir)
 
         requirements_build_path = Path(output_dir).joinpath(self.install_path)
-        command = [
-            "pip",
-            "install",
-            "-t",
-            str(requirements_build_path),
-            "-r",
-            str(Path(output_dir) / REQUIREMENTS_TXT_FILE),
-        ]
-        self._invoke_local_command("pip", command, cwd=self.to_bundle)
+        requirements_file = Path(output_dir) / REQUIREMENTS_TXT_FILE
+        cache_key = self._pip_cache_key(requirements_file)
+        cached_install = _pip_install_cache.get(cache_key)
+        if cached_install:
+            logger.info(
+                "%s pip: reusing dependencies installed for identical requirements",
+                self.to_bundle.name,
+            )
+        else:
+            cached_install = Path(_pip_install_cache_dir().name) / cache_key
+            # bytecode compiled here targets the local interpreter, not the Lambda runtime - skip it
+            command = [
+                "pip",
+                "install",
+                "--no-compile",
+                "-t",
+                str(cached_install),
+                "-r",
+                str(requirements_file),
+            ]
+            env = os.environ.copy()
+            env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+            self._invoke_local_command("pip", command, env=env, cwd=self.to_bundle)
+            _pip_install_cache[cache_key] = cached_install
+
+        copytree(cached_install, requirements_build_path)
+
+    def _pip_cache_key(self, requirements_file: Path) -> str:
+        """
+        Identify a pip install by the interpreter and requirements it was made with. Local requirements are resolved
+        relative to the bundled code, so the same relative path from two different bundles is not shared.
+        :param requirements_file: the requirements.txt file
+        :return: the cache key
+        """
+        digest = hashlib.sha256(sys.version.encode())
+        for requirement in requirements_file.read_text().splitlines():
+            requirement = requirement.strip()
+            if requirement and not requirement.startswith(("#", "-")):
+                local_requirement = (Path(self.to_bundle) / requirement).resolve()
+                if local_requirement.is_dir():
+                    requirement = str(local_requirement)
+            digest.update(requirement.encode() + b"\n")
+        return digest.hexdigest()
 
     def _local_bundle_with_pipenv(self, output_dir):
         if not self._source_file_exists(REQUIREMENTS_PIPENV_FILE, output_dir):
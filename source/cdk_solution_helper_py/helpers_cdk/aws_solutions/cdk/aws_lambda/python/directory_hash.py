@@ -13,8 +13,16 @@
 
 import hashlib
 import os
+from fnmatch import fnmatch
 from pathlib import Path
 
+# build output and bytecode are not inputs to a bundle - hashing them would change the hash on every build or test run
+DIRECTORY_HASH_EXCLUDES = ("__pycache__", "*.pyc", "build", "*.egg-info")
+
+
+def _excluded(name: str) -> bool:
+    return any(fnmatch(name, pattern) for pattern in DIRECTORY_HASH_EXCLUDES)
+
 
 class DirectoryHash:
     # fmt: off
@@ -33,9 +41,9 @@ class DirectoryHash:
     @classmethod
     def _hash_dir(cls, directory: Path):
         for path, dirs, files in os.walk(directory):
-            for file in sorted(files):
+            for file in sorted(f for f in files if not _excluded(f)):
                 DirectoryHash._hash_file(Path(path) / file)
-            for directory in sorted(dirs):
+            for directory in sorted(d for d in dirs if not _excluded(d)):
                 DirectoryHash._hash_dir(str((Path(path) / directory).absolute()))
             break
 
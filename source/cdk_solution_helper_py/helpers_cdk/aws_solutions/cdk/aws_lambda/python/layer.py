@@ -13,13 +13,13 @@
 
 from pathlib import Path
 from typing import Union, List
-from uuid import uuid4
 
 import aws_cdk as cdk
 from aws_cdk.aws_lambda import LayerVersion, Code
 from constructs import Construct
 from aws_cdk import BundlingOptions, AssetHashType
 
+from aws_solutions.cdk.aws_lambda.python.directory_hash import DirectoryHash
 from aws_solutions.cdk.aws_lambda.python.function import SolutionsPythonBundling
 
 DEPENDENCY_EXCLUDES = ["*.pyc"]
@@ -46,15 +46,15 @@ class SolutionsPythonLayerVersion(LayerVersion):
                 f"requirements_path {self.requirements_path} must not be a file, but rather a directory containing Python requirements in a requirements.txt file, pipenv format or poetry format"
             )
 
-        libraries = [] if not libraries else libraries
-        for lib in libraries:
+        self.libraries = [] if not libraries else libraries
+        for lib in self.libraries:
             if lib.is_file():
                 raise ValueError(
                     f"library {lib} must not be a file, but rather a directory"
                 )
 
         bundling = SolutionsPythonBundling(
-            self.requirements_path, libraries=libraries, install_path="python"
+            self.requirements_path, libraries=self.libraries, install_path="python"
         )
 
         kwargs["code"] = self._get_code(bundling)
@@ -67,7 +67,9 @@ class SolutionsPythonLayerVersion(LayerVersion):
         code_parameters = {
             "path": str(self.requirements_path),
             "asset_hash_type": AssetHashType.CUSTOM,
-            "asset_hash": uuid4().hex,
+            "asset_hash": DirectoryHash.hash(
+                self.requirements_path, *self.libraries, *self._local_requirements()
+            ),
             "exclude": DEPENDENCY_EXCLUDES,
         }
 
@@ -84,3 +86,23 @@ class SolutionsPythonLayerVersion(LayerVersion):
         )
 
         return code
+
+    def _local_requirements(self) -> List[Path]:
+        """
+        Get the local directories referenced from requirements.txt - their content is part of the layer, so must be
+        part of the layer asset hash (requirements pinned by version are covered by hashing requirements.txt)
+        :return: the local requirement directories
+        """
+        requirements = self.requirements_path / "requirements.txt"
+        if not requirements.is_file():
+            return []
+
+        local_requirements = []
+        for requirement in requirements.read_text().splitlines():
+            requirement = requirement.strip()
+            if not requirement or requirement.startswith(("#", "-")):
+                continue
+            path = (self.requirements_path / requirement).resolve()
+            if path.is_dir():
+                local_requirements.append(path)
+        return local_requirements
@@ -58,3 +58,23 @@ class CfnNagSuppressAll:
             == self.resource_type
         ):        
             add_cfn_nag_suppressions(node.node.default_child, self.suppressions)
+
+
+@jsii.implements(IAspect)
+class CfnNagSuppressPath:
+    """Suppress cfn_nag warnings on resources of a type created beneath constructs whose id starts with a prefix"""
+
+    def __init__(
+        self, suppress: List[CfnNagSuppression], resource_type: str, id_prefix: str
+    ):
+        self.suppressions = suppress
+        self.resource_type = resource_type
+        self.id_prefix = id_prefix
+
+    def visit(self, node: IConstruct):
+        if not ("is_cfn_element" in dir(node) and node.is_cfn_element(node)):
+            return
+        if getattr(node, "cfn_resource_type", None) != self.resource_type:
+            return
+        if any(scope.node.id.startswith(self.id_prefix) for scope in node.node.scopes):
+            add_cfn_nag_suppressions(node, self.suppressions)
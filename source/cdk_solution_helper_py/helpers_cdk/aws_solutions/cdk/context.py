@@ -46,22 +46,22 @@ class SolutionContext:
                 if len(args) == 0:
                     args = (context,)
 
-                # override the CDK context as required
+                # override the CDK context as required - on a copy, as the loaded context is shared by all decorators
                 if len(args) == 1:
-                    context.update(args[0])
+                    call_context = {**context, **args[0]}
 
                     env_context_var = environ.get(context_var_name)
                     if env_context_var:
-                        context[context_var_name] = env_context_var
+                        call_context[context_var_name] = env_context_var
                     elif context_var_name and context_var_value:
-                        context[context_var_name] = context_var_value
+                        call_context[context_var_name] = context_var_value
 
-                    if not context.get(context_var_name):
+                    if not call_context.get(context_var_name):
                         raise ValueError(
                             f"Missing cdk.json context variable or environment variable for {context_var_name}."
                         )
 
-                    args = (context,)
+                    args = (call_context,)
 
                 return f(*args)
 
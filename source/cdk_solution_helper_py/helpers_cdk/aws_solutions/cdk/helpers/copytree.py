@@ -43,15 +43,17 @@ def copytree(src, dst, symlinks=False, ignore=None):
     if not os.path.exists(dst):
         os.makedirs(dst)
 
-    for item in os.listdir(src):
-        s = os.path.join(src, item)
-        d = os.path.join(dst, item)
-
-        # ignore full directories upfront
-        if any(Path(s).match(ignored) for ignored in ignore):
-            continue
-
-        if os.path.isdir(s):
-            shutil.copytree(s, d, symlinks, ignore=ignore_globs(*ignore))
-        else:
-            shutil.copy2(s, d)
+    # scandir entries carry their file type, so no extra stat is needed to tell directories from files
+    with os.scandir(src) as entries:
+        for entry in entries:
+            s = entry.path
+            d = os.path.join(dst, entry.name)
+
+            # ignore full directories upfront
+            if any(Path(s).match(ignored) for ignored in ignore):
+                continue
+
+            if entry.is_dir():
+                shutil.copytree(s, d, symlinks, ignore=ignore_globs(*ignore))
+            else:
+                shutil.copy2(s, d)
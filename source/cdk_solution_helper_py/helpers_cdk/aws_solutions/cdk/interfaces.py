@@ -17,7 +17,10 @@ from typing import Union, List
 
 import jsii
 from aws_cdk import (
+    IAnyProducer,
+    IResolveContext,
     ITemplateOptions,
+    Lazy,
     Stack,
     NestedStack,
     CfnParameter,
@@ -43,8 +46,6 @@ class TemplateOptionsException(Exception):
 class TemplateOptions:
     """Helper class for setting up template CloudFormation parameter groups, labels and solutions metadata"""
 
-    _metadata = {}
-
     def __init__(
         self,
         stack: Union[Stack, NestedStack],
@@ -56,9 +57,12 @@ class TemplateOptions:
         self.filename = filename
         self._parameters: List[_TemplateParameter] = []
         self.stack.template_options.description = description
-        self.stack.template_options.metadata = self.metadata
 
-        self._metadata = self._get_metadata()
+        # the metadata is set on the stack once - the parameter interface is only resolved at synthesis
+        self.stack.template_options.metadata = {
+            "AWS::CloudFormation::Interface": Lazy.any(_TemplateInterface(self)),
+            "aws:solutions:templatename": self.filename,
+        }
 
         if not filename.endswith(".template"):
             raise TemplateOptionsException("template filenames must end with .template")
@@ -74,38 +78,46 @@ class TemplateOptions:
 
     @property
     def metadata(self) -> dict:
-        return self._metadata
+        return {
+            "AWS::CloudFormation::Interface": self._get_interface(),
+            "aws:solutions:templatename": self.filename,
+        }
 
-    def _get_metadata(self) -> dict:
+    def _get_interface(self) -> dict:
         pgs = set()
         parameter_groups = [
             p.group
             for p in self._parameters
             if p.group not in pgs and not pgs.add(p.group)
         ]
-        metadata = {
-            "AWS::CloudFormation::Interface": {
-                "ParameterGroups": [
-                    {
-                        "Label": {"default": parameter_group},
-                        "Parameters": [
-                            parameter.name
-                            for parameter in self._parameters
-                            if parameter.group == parameter_group
-                        ],
-                    }
-                    for parameter_group in parameter_groups
-                ],
-                "ParameterLabels": {
-                    parameter.name: {"default": parameter.label}
-                    for parameter in self._parameters
-                },
+        return {
+            "ParameterGroups": [
+                {
+                    "Label": {"default": parameter_group},
+                    "Parameters": [
+                        parameter.name
+                        for parameter in self._parameters
+                        if parameter.group == parameter_group
+                    ],
+                }
+                for parameter_group in parameter_groups
+            ],
+            "ParameterLabels": {
+                parameter.name: {"default": parameter.label}
+                for parameter in self._parameters
             },
-            "aws:solutions:templatename": self.filename,
         }
-        self.stack.template_options.metadata = metadata
-        return metadata
 
     def add_parameter(self, parameter: CfnParameter, label: str, group: str):
         self._parameters.append(_TemplateParameter(parameter.logical_id, label, group))
-        self._metadata = self._get_metadata()
+
+
+@jsii.implements(IAnyProducer)
+class _TemplateInterface:
+    """Produces the CloudFormation interface of a TemplateOptions once its parameters are known"""
+
+    def __init__(self, template_options: TemplateOptions):
+        self.template_options = template_options
+
+    def produce(self, context: IResolveContext) -> dict:
+        return self.template_options._get_interface()
@@ -10,10 +10,23 @@
 #  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for  #
 #  the specific language governing permissions and limitations under the License.                                     #
 # #####################################################################################################################
+from functools import lru_cache
 from typing import Optional
 
 from constructs import Construct
-from aws_cdk import CfnMapping
+from aws_cdk import CfnMapping, Fn
+
+
+@lru_cache(maxsize=None)
+def source_bucket() -> str:
+    """The SourceCode S3Bucket mapping value (the solution asset bucket name, without region suffix)"""
+    return Fn.find_in_map("SourceCode", "General", "S3Bucket")
+
+
+@lru_cache(maxsize=None)
+def source_key_prefix() -> str:
+    """The SourceCode KeyPrefix mapping value (the solution asset key prefix)"""
+    return Fn.find_in_map("SourceCode", "General", "KeyPrefix")
 
 
 class Mappings:
@@ -0,0 +1,27 @@
+# ######################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                  #
+#                                                                                                                      #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance      #
+#  with the License. You may obtain a copy of the License at                                                           #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed    #
+#  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for   #
+#  the specific language governing permissions and limitations under the License.                                      #
+# ######################################################################################################################
+
+from aws_cdk.aws_stepfunctions_tasks import GlueStartJobRun
+
+
+class FullJitterGlueStartJobRun(GlueStartJobRun):
+    """
+    A GlueStartJobRun task whose retriers use full jitter. Retries of this task are typically caused by contention
+    (e.g. Glue.ConcurrentRunsExceededException) - jitter keeps concurrent executions from retrying in lockstep.
+    """
+
+    def to_state_json(self):
+        state = super().to_state_json()
+        for retry in state.get("Retry", []):
+            retry["JitterStrategy"] = "FULL"
+        return state
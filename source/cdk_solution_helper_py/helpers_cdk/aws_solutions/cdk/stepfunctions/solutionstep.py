@@ -16,9 +16,9 @@ from typing import Optional, List
 
 from constructs import Construct
 from aws_cdk.aws_events import EventBus
-from aws_cdk.aws_lambda import Tracing, Runtime, RuntimeFamily
+from aws_cdk.aws_lambda import Tracing, Runtime, RuntimeFamily, IFunction
 from aws_cdk.aws_stepfunctions import IChainable, TaskInput, State
-from aws_cdk import Duration
+from aws_cdk import Duration, Fn, Aws, CfnCondition, RemovalPolicy
 
 from aws_solutions.cdk.aws_lambda.environment import Environment
 from aws_solutions.cdk.aws_lambda.python.function import SolutionsPythonFunction
@@ -73,6 +73,7 @@ class SolutionStep(Construct):
         self._output_path = output_path
         self._payload = payload
         self._failure_state = failure_state
+        self._invoke_target: IFunction = self.function
 
         self._create_resources()
         self._set_permissions()
@@ -99,7 +100,7 @@ class SolutionStep(Construct):
         return SolutionFragment(
             scope,
             construct_id,
-            function=self.function,
+            function=self._invoke_target,
             payload=payload,
             input_path=input_path,
             result_path=result_path,
@@ -109,6 +110,38 @@ class SolutionStep(Construct):
             **kwargs,
         )
 
+    def add_provisioned_concurrency(
+        self,
+        executions: int,
+        condition: Optional[CfnCondition] = None,
+        version_inputs: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Invoke this step through a "live" alias of the function's current version with provisioned concurrency
+        :param executions: The number of provisioned concurrent executions (may be a parameter token)
+        :param condition: If provided, provisioned concurrency is only configured when this condition is true
+        :param version_inputs: Deploy-time values (e.g. parameter tokens) used in the function configuration. The
+        current version only changes when the synthesized function changes - these are added to the version
+        description so that a new version is also published when any of them change on a stack update.
+        """
+        version = self.function.current_version
+        version.apply_removal_policy(RemovalPolicy.DESTROY)
+        if version_inputs:
+            version.node.default_child.add_property_override(
+                "Description", Fn.join(" ", version_inputs)
+            )
+        alias = self.function.add_alias("live")
+
+        provisioned_concurrency = {"ProvisionedConcurrentExecutions": executions}
+        if condition:
+            provisioned_concurrency = Fn.condition_if(
+                condition.logical_id, provisioned_concurrency, Aws.NO_VALUE
+            )
+        alias.node.default_child.add_property_override(
+            "ProvisionedConcurrencyConfig", provisioned_concurrency
+        )
+        self._invoke_target = alias
+
     def _snake_case(self, name) -> str:
         return name.replace(" ", "_").lower()
 
@@ -15,9 +15,10 @@ import logging
 import os
 import re
 import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import field, dataclass
-from fileinput import FileInput
 from pathlib import Path
 from typing import List, Dict
 
@@ -27,6 +28,21 @@ from aws_cdk import IStackSynthesizer, DefaultStackSynthesizer, ISynthesisSessio
 logger = logging.getLogger("cdk-helper")
 
 
+def _zip_directory(source: Path) -> Path:
+    """
+    Zip the contents of a directory asset into an archive beside it. Files are deflated by zlib, which releases the GIL,
+    so several assets can be zipped concurrently from threads.
+    :param source: the asset directory
+    :return: the path to the archive
+    """
+    logger.info(f"{source.name} packaging into .zip file")
+    archive = source.with_name(f"{source.name}.zip")
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for path in sorted(source.rglob("*")):
+            zip_file.write(path, path.relative_to(source))
+    return archive
+
+
 @dataclass
 class CloudFormationTemplate:
     """Encapsulates the transformations that are required on a CDK generated CloudFormation template for AWS Solutions"""
@@ -67,15 +83,17 @@ class CloudFormationTemplate:
 
     def delete_cdk_helpers(self):
         """Remove the CDK bucket deployment helpers, since solutions don't have a bootstrap bucket."""
-        to_delete = []
-        for (resource_name, resource) in self.contents.get("Resources", {}).items():
-            if "Custom::CDKBucketDeployment" in resource["Type"]:
-                to_delete.append(resource_name)
-            if "CDKBucketDeployment" in resource_name:
-                to_delete.append(resource_name)
-        for resource in to_delete:
-            logger.info(f"deleting resource {resource}")
-            del self.contents["Resources"][resource]
+        resources = self.contents.get("Resources")
+        if not resources:
+            return
+
+        kept = {}
+        for (resource_name, resource) in resources.items():
+            if "Custom::CDKBucketDeployment" in resource["Type"] or "CDKBucketDeployment" in resource_name:
+                logger.info(f"deleting resource {resource_name}")
+            else:
+                kept[resource_name] = resource
+        self.contents["Resources"] = kept
 
     def patch_nested(self):
         """Patch nested stacks for S3 deployment compatibility"""
@@ -120,6 +138,7 @@ class CloudFormationTemplate:
 
     def patch_lambda(self):
         """Patch the lambda functions for S3 deployment compatibility"""
+        lambdas = []
         for (resource_name, resource) in self.contents.get("Resources", {}).items():
             resource_type = resource.get("Type")
             if resource_type == "AWS::Lambda::Function" or resource_type == "AWS::Lambda::LayerVersion":
@@ -137,56 +156,60 @@ class CloudFormationTemplate:
                     continue
 
                 asset = self.assets["files"][resource_id]
-                asset_source_path = self.path.parent.joinpath(asset["source"]["path"])
                 asset_packaging = asset["source"]["packaging"]
-
-                # CDK does not zip assets prior to deployment - we do it here if a zip asset is detected
-                if asset_packaging == "zip":
-                    # create archive if necessary
-                    logger.info(f"{resource_name} packaging into .zip file")
-                    archive = shutil.make_archive(
-                        base_name=asset_source_path,
-                        format="zip",
-                        root_dir=str(asset_source_path),
-                    )
-                elif asset_packaging == "file":
-                    archive = self.cloud_assembly_path.joinpath(asset["source"]["path"])
-                else:
+                if asset_packaging not in ("zip", "file"):
                     raise ValueError(f"Unsupported asset packaging format: {asset_packaging}")
+                lambdas.append((resource_name, resource, content_key, asset))
+
+        # CDK does not zip assets prior to deployment - we do it here, once per asset, compressing assets concurrently
+        zip_sources = {
+            self.path.parent.joinpath(asset["source"]["path"])
+            for (_, _, _, asset) in lambdas
+            if asset["source"]["packaging"] == "zip"
+        }
+        with ThreadPoolExecutor() as executor:
+            archives = dict(zip(zip_sources, executor.map(_zip_directory, zip_sources)))
+
+        for (resource_name, resource, content_key, asset) in lambdas:
+            # rename archive to match the resource name it was generated for (zip archives may be shared - copy those)
+            archive_name = f"{resource_name}.zip"
+            archive_path = self.cloud_assembly_path.joinpath(archive_name)
+            if asset["source"]["packaging"] == "zip":
+                shutil.copy(src=archives[self.path.parent.joinpath(asset["source"]["path"])], dst=archive_path)
+            else:
+                shutil.move(src=self.cloud_assembly_path.joinpath(asset["source"]["path"]), dst=archive_path)
+
+            # update CloudFormation resource properties for S3Bucket and S3Key
+            # fmt: off
+            resource["Properties"][content_key]["S3Bucket"] = {
+                "Fn::Join": [ # NOSONAR (python:S1192) - string for clarity
+                    "-",
+                    [
+                        {
+                            "Fn::FindInMap": ["SourceCode", "General", "S3Bucket"]  # NOSONAR (python:S1192) - string for clarity
+                        },
+                        {"Ref": "AWS::Region"},
+                    ],
+                ]
+            }
+            resource["Properties"][content_key]["S3Key"] = {
+                "Fn::Join": [  # NOSONAR (python:S1192) - string for clarity
+                    "/",
+                    [
+                        {
+                            "Fn::FindInMap": ["SourceCode", "General", "KeyPrefix"]  # NOSONAR (python:S1192) - string for clarity
+                        },
+                        archive_name,
+                    ],
+                ]
+            }
+            # fmt: on
 
-                # rename archive to match the resource name it was generated for
-                archive_name = f"{resource_name}.zip"
-                archive_path = self.cloud_assembly_path.joinpath(archive_name)
-                shutil.move(src=archive, dst=archive_path)
+            # add resource to the list of regional assets
+            self.assets_regional.append(archive_path)
 
-                # update CloudFormation resource properties for S3Bucket and S3Key
-                # fmt: off
-                resource["Properties"][content_key]["S3Bucket"] = {
-                    "Fn::Join": [ # NOSONAR (python:S1192) - string for clarity
-                        "-",
-                        [
-                            {
-                                "Fn::FindInMap": ["SourceCode", "General", "S3Bucket"]  # NOSONAR (python:S1192) - string for clarity
-                            },
-                            {"Ref": "AWS::Region"},
-                        ],
-                    ]
-                }
-                resource["Properties"][content_key]["S3Key"] = {
-                    "Fn::Join": [  # NOSONAR (python:S1192) - string for clarity
-                        "/",
-                        [
-                            {
-                                "Fn::FindInMap": ["SourceCode", "General", "KeyPrefix"]  # NOSONAR (python:S1192) - string for clarity
-                            },
-                            archive_name,
-                        ],
-                    ]
-                }
-                # fmt: on
-
-                # add resource to the list of regional assets
-                self.assets_regional.append(archive_path)
+        for archive in archives.values():
+            archive.unlink()
 
     def patch_app_reg(self):
         """Patch the App Registry Info"""
@@ -287,7 +310,7 @@ class SolutionStackSubstitions(DefaultStackSynthesizer):
                 templates.append(assembly_output_path.joinpath(child_template))
         return templates
 
-    def _templates(self, session: ISynthesisSession) -> (Path, Dict):
+    def _templates(self, session: ISynthesisSession, templates: Dict[Path, str]) -> (Path, Dict):
         assembly_output_path = Path(session.assembly.outdir)
 
         assets = {}
@@ -296,8 +319,8 @@ class SolutionStackSubstitions(DefaultStackSynthesizer):
         except StopIteration:
             pass  # use the default (no assets)
 
-        for path in self._template_names(session):
-            yield CloudFormationTemplate(path, json.loads(path.read_text()), assets)
+        for path, template in templates.items():
+            yield CloudFormationTemplate(path, json.loads(template), assets)
 
     def synthesize(self, session: ISynthesisSession):
         # when called with `cdk deploy` this outputs to cdk.out
@@ -308,22 +331,26 @@ class SolutionStackSubstitions(DefaultStackSynthesizer):
         asset_path_global = self._stack.node.try_get_context("SOLUTIONS_ASSETS_GLOBAL")
 
         logger.info(f"solutions parameter substitution in {session.assembly.outdir} started")
+        replacements = {}
+
+        def substitute(match):
+            placeholder = match.group(0).replace("%", "")
+            if placeholder not in replacements:
+                replacement = self._stack.node.try_get_context(placeholder)
+                if not replacement:
+                    raise ValueError(
+                        f"Please provide a parameter substitution for {placeholder} via environment variable or CDK context"
+                    )
+                replacements[placeholder] = replacement
+            return replacements[placeholder]
+
+        # keep the substituted templates so that they need not be read back for customization
+        templates = {}
         for template in self._template_names(session):
             logger.info(f"substutiting parameters in {str(template)}")
-            with FileInput(template, inplace=True) as template_lines:
-                for line in template_lines:
-                    # handle all template subsitutions in the line
-                    for match in SolutionStackSubstitions.substitution_re.findall(line):
-                        placeholder = match.replace("%", "")
-                        replacement = self._stack.node.try_get_context(placeholder)
-                        if not replacement:
-                            raise ValueError(
-                                f"Please provide a parameter substitution for {placeholder} via environment variable or CDK context"
-                            )
-
-                        line = line.replace(match, replacement)
-                    # print the (now substituted) line in the context of template_lines
-                    print(line, end="")
+            # handle all template substitutions in a single pass over the template
+            templates[template] = SolutionStackSubstitions.substitution_re.sub(substitute, template.read_text())
+            template.write_text(templates[template])
             logger.info(f"substituting parameters in {str(template)} completed")
         logger.info("solutions parameter substitution completed")
 
@@ -332,7 +359,7 @@ class SolutionStackSubstitions(DefaultStackSynthesizer):
             return
 
         logger.info(f"solutions template customization in {session.assembly.outdir} started")
-        for template in self._templates(session):
+        for template in self._templates(session, templates):
             template.patch_lambda()
             template.patch_nested()
             template.patch_app_reg()
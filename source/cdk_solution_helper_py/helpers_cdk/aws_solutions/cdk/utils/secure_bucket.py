@@ -23,6 +23,13 @@ from aws_solutions.cdk.cfn_nag import add_cfn_nag_suppressions, CfnNagSuppressio
 
 logger = logging.getLogger("cdk-helper")
 
+# bucket configuration applied unless explicitly overridden
+SECURE_BUCKET_DEFAULTS = (
+    ("removal_policy", RemovalPolicy.RETAIN),
+    ("encryption", BucketEncryption.S3_MANAGED),
+    ("block_public_access", BlockPublicAccess.BLOCK_ALL),
+)
+
 
 class SecureBucket(Bucket):
     def __init__(
@@ -34,15 +41,8 @@ class SecureBucket(Bucket):
     ):
         self.construct_id = construct_id
 
-        kwargs = self.override_configuration(
-            kwargs, "removal_policy", RemovalPolicy.RETAIN
-        )
-        kwargs = self.override_configuration(
-            kwargs, "encryption", BucketEncryption.S3_MANAGED
-        )
-        kwargs = self.override_configuration(
-            kwargs, "block_public_access", BlockPublicAccess.BLOCK_ALL
-        )
+        for key, default in SECURE_BUCKET_DEFAULTS:
+            kwargs = self.override_configuration(kwargs, key, default)
 
         super().__init__(scope, construct_id, **kwargs)
 
@@ -33,6 +33,7 @@ CLIENT_CONFIG = Config(
 
 # declaring these global makes initialization/ performance a bit better if generating many forecasts
 _helpers_service_clients = dict()
+_helpers_aws_account_id = None
 
 
 class ResourcePending(Exception):
@@ -141,11 +142,14 @@ def get_sfn_client():
 
 def get_aws_account_id():
     """
-    Get the caller's AWS account ID
+    Get the caller's AWS account ID (cached in the execution context of the lambda)
     :return: The AWS account ID
     """
-    sts_client = get_sts_client()
-    return sts_client.get_caller_identity().get("Account")
+    global _helpers_aws_account_id
+    if not _helpers_aws_account_id:
+        sts_client = get_sts_client()
+        _helpers_aws_account_id = sts_client.get_caller_identity().get("Account")
+    return _helpers_aws_account_id
 
 
 def get_aws_region():
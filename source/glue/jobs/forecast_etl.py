@@ -72,6 +72,24 @@ CLIENT_CONFIG = Config(
     user_agent_extra=f"AwsSolution/{SOLUTION_ID}/{SOLUTION_VERSION}",
 )
 
+# boto3 clients are shared across the ETL objects created in a single job run
+_service_clients = dict()
+
+
+def get_service_client(service_name, region_name=None):
+    """
+    Get a cached boto3 client for a service (and region)
+    :param service_name: the AWS service name (e.g. s3, forecast)
+    :param region_name: the AWS region name (uses the default region if not provided)
+    :return: the boto3 client
+    """
+    key = (service_name, region_name)
+    if key not in _service_clients:
+        _service_clients[key] = boto3.client(
+            service_name, region_name=region_name, config=CLIENT_CONFIG
+        )
+    return _service_clients[key]
+
 
 class Schema:
     """Hold information about an Amazon Forecast Schema"""
@@ -145,7 +163,7 @@ class ForecastStatus:
         :param region: region for forecast service
         :param account: string AWS account ID
         """
-        self.cli = boto3.client("forecast", region_name=region, config=CLIENT_CONFIG)
+        self.cli = get_service_client("forecast", region_name=region)
         self.region = region
         self.account = account
         self.name = name
@@ -715,7 +733,7 @@ class ETL:
         :param target_field: the target field used in this forecast domain
         :param header: whether or not the data has a header - or if we should auto-detect (e.g. input data)
         """
-        self.s3_cli = boto3.client("s3", config=CLIENT_CONFIG)
+        self.s3_cli = get_service_client("s3")
         self.name = name
         self.schema = schema
         self.source = source
@@ -28,10 +28,10 @@ solution = CDKSolution(cdk_json_path=Path(__file__).parent.absolute() / "cdk.jso
 @solution.context.requires("SOLUTION_ID")
 @solution.context.requires("SOLUTION_VERSION")
 @solution.context.requires("BUCKET_NAME")
-@solution.context.requires("NOTEBOOKS", forecast.sagemaker.notebook.context)
+@solution.context.requires("NOTEBOOKS", forecast.sagemaker.notebook.notebook_context())
 
 def build_app(context):
-    app = cdk.App(context=context)
+    app = cdk.App(context=context, stack_traces=False)
 
     stack = ForecastStack(
         app,
@@ -15,6 +15,8 @@ from constructs import Construct
 
 from aws_solutions.cdk.stepfunctions.solutionstep import SolutionStep
 
+LAMBDAS_PATH = Path(__file__).absolute().parents[4] / "lambdas"
+
 
 class Base(SolutionStep):
     def __init__(
@@ -34,9 +36,7 @@ class Base(SolutionStep):
             scope,
             id,
             layers=layers,
-            entrypoint=(
-                Path(__file__).absolute().parents[4] / "lambdas" / name / handler
-            ),
+            entrypoint=LAMBDAS_PATH / name / handler,
             function=function,
             **kwargs,
         )
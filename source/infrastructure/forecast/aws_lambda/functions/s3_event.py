@@ -10,8 +10,7 @@
 #  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for  #
 #  the specific language governing permissions and limitations under the License.                                     #
 # #####################################################################################################################
-from pathlib import Path
-
+from aws_cdk.aws_iam import ManagedPolicy, PolicyStatement
 from aws_cdk.aws_lambda import Runtime, RuntimeFamily, Tracing
 from aws_cdk.aws_s3 import Bucket
 from aws_cdk.aws_stepfunctions import StateMachine
@@ -19,6 +18,9 @@ from constructs import Construct
 
 from aws_solutions.cdk.aws_lambda.python.function import SolutionsPythonFunction
 from aws_solutions.cdk.cfn_nag import add_cfn_nag_suppressions, CfnNagSuppression
+from forecast.aws_lambda.functions.base import LAMBDAS_PATH
+
+DEFAULT_S3_KEY = "forecast-defaults.yaml"  # the handler reads the forecast configuration from this key
 
 
 class S3EventHandler(SolutionsPythonFunction):
@@ -30,12 +32,7 @@ class S3EventHandler(SolutionsPythonFunction):
         bucket: Bucket,
         **kwargs
     ):
-        entrypoint = (
-            Path(__file__).absolute().parents[4]
-            / "lambdas"
-            / "notification"
-            / "handler.py"
-        )
+        entrypoint = LAMBDAS_PATH / "notification" / "handler.py"
         _function = "notification"
         kwargs["runtime"] = Runtime("python3.8", RuntimeFamily.PYTHON)
         kwargs["tracing"] = Tracing.ACTIVE
@@ -44,7 +41,7 @@ class S3EventHandler(SolutionsPythonFunction):
         self.add_environment("STATE_MACHINE_ARN", state_machine.state_machine_arn)
 
         state_machine.grant_start_execution(self)
-        bucket.grant_read(self, objects_key_pattern="train/*")
+        self.role.add_managed_policy(self._train_read_policy(bucket))
         add_cfn_nag_suppressions(
             self.role.node.try_find_child("DefaultPolicy").node.find_child("Resource"),
             [
@@ -58,3 +55,25 @@ class S3EventHandler(SolutionsPythonFunction):
                 ),
             ],
         )
+
+    def _train_read_policy(self, bucket: Bucket) -> ManagedPolicy:
+        """Read access to the train/ prefix and the forecast defaults of the bucket, attached once to the function role"""
+        return ManagedPolicy(
+            self,
+            "S3TrainRead",
+            statements=[
+                PolicyStatement(
+                    actions=["s3:GetObject"],
+                    resources=[
+                        bucket.arn_for_objects("train/*"),
+                        bucket.arn_for_objects(DEFAULT_S3_KEY),
+                    ],
+                ),
+                # without ListBucket, S3 reports a missing forecast defaults file as AccessDenied rather than
+                # NoSuchKey. GetObject requests carry no s3:prefix, so this cannot be conditioned on one
+                PolicyStatement(
+                    actions=["s3:ListBucket"],
+                    resources=[bucket.bucket_arn],
+                ),
+            ],
+        )
@@ -10,14 +10,13 @@
 #  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for  #
 #  the specific language governing permissions and limitations under the License.                                     #
 # #####################################################################################################################
-from pathlib import Path
-
 from constructs import Construct
 from aws_cdk.aws_sns import TopicProps, Subscription, SubscriptionProtocol
 from aws_cdk import Aspects, CfnParameter, CfnCondition
 from aws_solutions_constructs.aws_lambda_sns import LambdaToSns
 from aws_solutions.cdk.aspects import ConditionalResources
 from aws_solutions.cdk.stepfunctions.solutionstep import SolutionStep
+from forecast.aws_lambda.functions.base import LAMBDAS_PATH
 
 class Notifications(SolutionStep):
     def __init__(
@@ -38,9 +37,7 @@ class Notifications(SolutionStep):
             scope,
             id,
             layers=layers,
-            entrypoint=(
-                Path(__file__).absolute().parents[4] / "lambdas" / "sns" / "handler.py"
-            ),
+            entrypoint=LAMBDAS_PATH / "sns" / "handler.py",
             function="sns",
             **kwargs,
         )
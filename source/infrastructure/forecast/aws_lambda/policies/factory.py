@@ -57,6 +57,15 @@ class PolicyFactory(Construct):
         self.forecast_service_rw_role = self._forecast_role(
             data_bucket, read=True, write=True
         )
+        self.forecast_access_policy = self._forecast_access_policy()
+        self.forecast_ro_passrole_policy = self._forecast_passrole_policy(
+            "ForecastS3ReadRolePassRole", self.forecast_service_ro_role
+        )
+        self.forecast_rw_passrole_policy = self._forecast_passrole_policy(
+            "ForecastS3ReadWriteRolePassRole", self.forecast_service_rw_role
+        )
+        self.data_read_policy = self._data_bucket_policy(data_bucket, write=False)
+        self.data_read_write_policy = self._data_bucket_policy(data_bucket, write=True)
 
     def _kms_read_policy(self):
         policy = Policy(
@@ -151,35 +160,94 @@ class PolicyFactory(Construct):
             self.kms_write_policy.attach_to_role(role)
         return role
 
-    def _grant_forecast_access(self, grantee: IGrantable):
-        grantee.grant_principal.add_to_principal_policy(
+    def _forecast_access_policy(self) -> Policy:
+        policy = Policy(
+            self,
+            "ForecastAccess",
+            statements=[
+                PolicyStatement(
+                    actions=[
+                        "forecast:Describe*",
+                        "forecast:List*",
+                        "forecast:Create*",
+                        "forecast:Update*",
+                        "forecast:TagResource",
+                    ],
+                    resources=["*"], # NOSONAR - This is allowed since it is only attached to the workflow functions
+                )
+            ],
+        )
+        add_cfn_nag_suppressions(
+            policy.node.default_child,
+            [
+                CfnNagSuppression(
+                    "W12",
+                    "Require access to all resources; Not all Amazon Forecast resources support resource based policy",
+                )
+            ],
+        )
+        return policy
+
+    def _forecast_passrole_policy(self, id: str, role: Role) -> Policy:
+        return Policy(
+            self,
+            id,
+            statements=[
+                PolicyStatement(actions=["iam:PassRole"], resources=[role.role_arn])
+            ],
+        )
+
+    def _data_bucket_policy(self, data_bucket: Bucket, write=False) -> Policy:
+        statements = [
             PolicyStatement(
-                actions=[
-                    "forecast:Describe*",
-                    "forecast:List*",
-                    "forecast:Create*",
-                    "forecast:Update*",
-                    "forecast:TagResource",
-                ],
-                resources=["*"], # NOSONAR - This is allowed since it is set for the passed in grantee
+                actions=["s3:GetObject*", "s3:GetBucket*", "s3:List*"],
+                resources=[data_bucket.bucket_arn, data_bucket.arn_for_objects("*")],
+            )
+        ]
+        if write:
+            statements.append(
+                PolicyStatement(
+                    actions=[
+                        "s3:DeleteObject*",
+                        "s3:PutObject",
+                        "s3:PutObjectLegalHold",
+                        "s3:PutObjectRetention",
+                        "s3:PutObjectTagging",
+                        "s3:PutObjectVersionTagging",
+                        "s3:Abort*",
+                    ],
+                    resources=[data_bucket.arn_for_objects("*")],
+                )
             )
+        return Policy(
+            self,
+            "ForecastBucketReadWrite" if write else "ForecastBucketRead",
+            statements=statements,
         )
 
-    def _grant_forecast_passrole(self, grantee: IGrantable, role: Role):
-        grantee.grant_principal.add_to_principal_policy(
-            PolicyStatement(actions=["iam:PassRole"], resources=[role.role_arn])
-        )
+    def _grant_forecast_passrole(self, grantee: IGrantable, policy: Policy, role: Role):
+        policy.attach_to_role(grantee.grant_principal)
         if isinstance(grantee, Function):
             grantee.add_environment("FORECAST_ROLE", role.role_arn)
             grantee.add_environment("FORECAST_KMS", self.kms_key_arn)
 
     def grant_forecast_read(self, grantee: IGrantable):
-        self._grant_forecast_access(grantee)
-        self._grant_forecast_passrole(grantee, self.forecast_service_ro_role)
+        self.forecast_access_policy.attach_to_role(grantee.grant_principal)
+        self._grant_forecast_passrole(
+            grantee, self.forecast_ro_passrole_policy, self.forecast_service_ro_role
+        )
 
     def grant_forecast_read_write(self, grantee: IGrantable):
-        self._grant_forecast_access(grantee)
-        self._grant_forecast_passrole(grantee, self.forecast_service_rw_role)
+        self.forecast_access_policy.attach_to_role(grantee.grant_principal)
+        self._grant_forecast_passrole(
+            grantee, self.forecast_rw_passrole_policy, self.forecast_service_rw_role
+        )
+
+    def grant_data_read(self, grantee: IGrantable):
+        self.data_read_policy.attach_to_role(grantee.grant_principal)
+
+    def grant_data_read_write(self, grantee: IGrantable):
+        self.data_read_write_policy.attach_to_role(grantee.grant_principal)
 
     def quicksight_access(
         self,
@@ -28,6 +28,11 @@ class DataBucket(SecureBucket):
                     enabled=True,
                 ),
                 LifecycleRule(expiration=Duration.days(1), prefix="raw/", enabled=True),
+                LifecycleRule(
+                    expiration=Duration.days(30),
+                    prefix="glue/spark-event-logs/",
+                    enabled=True,
+                ),
             ],
             **kwargs
         )
@@ -14,6 +14,16 @@ from constructs import Construct
 from aws_cdk.aws_s3 import IBucket
 from aws_cdk import CfnResource, Aws
 
+# static workgroup settings - only the result output location depends on the stack
+WORKGROUP_CONFIGURATION = {
+    "EnforceWorkGroupConfiguration": True,
+    "EngineVersion": {"SelectedEngineVersion": "Athena engine version 3"},
+}
+WORKGROUP_RESULT_CONFIGURATION = {
+    "EncryptionConfiguration": {"EncryptionOption": "SSE_S3"},
+}
+
+
 class Athena(Construct):
     def __init__(self, scope: Construct, id: str, athena_bucket: IBucket):
         super().__init__(scope, id)
@@ -29,15 +39,12 @@ class Athena(Construct):
                 "State": "ENABLED",
                 "RecursiveDeleteOption": True,
                 "WorkGroupConfiguration": {
-                    "EnforceWorkGroupConfiguration": True,
-                    "EngineVersion": {
-                        "SelectedEngineVersion": "Athena engine version 3"
-                    },
+                    **WORKGROUP_CONFIGURATION,
                     "ResultConfiguration": {
                         "OutputLocation": athena_bucket.s3_url_for_object(
                             "query-results"
                         ),
-                        "EncryptionConfiguration": {"EncryptionOption": "SSE_S3"},
+                        **WORKGROUP_RESULT_CONFIGURATION,
                     },
                 },
             },
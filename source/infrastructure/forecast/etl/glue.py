@@ -16,8 +16,9 @@ import aws_cdk.aws_iam as iam
 from constructs import Construct
 from aws_cdk.aws_s3 import IBucket, Location
 from aws_cdk.aws_s3_deployment import BucketDeployment, Source
-from aws_cdk import Aws, CfnResource, Fn
+from aws_cdk import Aws, CfnResource
 
+from aws_solutions.cdk import mappings
 from aws_solutions.cdk.aws_lambda.cfn_custom_resources.url_downloader import (
     UrlDownloader,
 )
@@ -35,10 +36,15 @@ class Glue(Construct):
         forecast_bucket: IBucket,
         athena_bucket: IBucket,
         glue_jobs_path: Path,
-    ):
+        max_concurrent_runs: int = 30,
+        worker_type: str = "G.1X",
+        number_of_workers: int = 10,
+    ):  # NOSONAR (python:S107) - allow large number of method parameters
         super().__init__(scope, id)
 
         self.policies = GluePolicies()
+        source_bucket = mappings.source_bucket()
+        source_key_prefix = mappings.source_key_prefix()
 
         # implementation of CDK CfnDatabase is incomplete, use CfnResource
         self.database = CfnResource(
@@ -63,7 +69,9 @@ class Glue(Construct):
                 "S3SolutionAccess": self.policies.s3_read_write_access(
                     [athena_bucket, forecast_bucket]
                 ),
-                "S3StackAccess": self.policies.s3_solutions_read_access(),
+                "S3StackAccess": self.policies.s3_solutions_read_access(
+                    source_bucket=source_bucket
+                ),
                 "ForecastRead": self.policies.forecast_read(),
                 "CloudwatchLogsAccess": self.policies.cloudwatch_logs_write(),
                 "GlueAccess": self.policies.glue_access(
@@ -90,8 +98,8 @@ class Glue(Construct):
                 self,
                 "GlueJob",
                 source=Location(
-                    bucket_name=f"{Fn.find_in_map('SourceCode', 'General', 'S3Bucket')}-{Aws.REGION}",
-                    object_key=f"{Fn.find_in_map('SourceCode', 'General', 'KeyPrefix')}/glue/jobs/forecast_etl.py",
+                    bucket_name=f"{source_bucket}-{Aws.REGION}",
+                    object_key=f"{source_key_prefix}/glue/jobs/forecast_etl.py",
                 ),
                 destination=Location(
                     bucket_name=forecast_bucket.bucket_name,
@@ -100,13 +108,17 @@ class Glue(Construct):
             )
         else:
             # deploy the asset (from CDK assets)
-            sources = [Source.asset(path=str(glue_jobs_path))]
+            sources = [
+                Source.asset(path=str(glue_jobs_path), exclude=["__pycache__", "*.pyc"])
+            ]
             self.glue_script_deployment = BucketDeployment(
                 self,
                 "GlueJob",
                 destination_bucket=forecast_bucket,
                 destination_key_prefix="glue",
                 sources=sources,
+                prune=False,
+                memory_limit=1024,
             )
 
         self.glue_job = CfnResource(
@@ -129,16 +141,24 @@ class Glue(Construct):
                     "--account_id": Aws.ACCOUNT_ID,
                     "--database": self.database.ref,
                     "--data_bucket": forecast_bucket.bucket_name,
+                    # each run writes a new (timestamped) table holding the full dataset group history,
+                    # so the inputs must always be read in full - bookmarks would produce empty tables
                     "--job-bookmark-option": "job-bookmark-disable",
                     "--job-language": "python",
                     "--encryption-type": "sse-s3",
                     "--additional-python-modules": "boto3==1.26.83",
+                    "--enable-auto-scaling": "true",
+                    "--enable-metrics": "true",
+                    "--enable-spark-ui": "true",
+                    "--spark-event-logs-path": forecast_bucket.s3_url_for_object(
+                        "glue/spark-event-logs/"
+                    ),
                 },
-                "GlueVersion": "2.0",
-                "WorkerType": "G.1X",
-                "NumberOfWorkers": 2,
+                "GlueVersion": "4.0",
+                "WorkerType": worker_type,
+                "NumberOfWorkers": number_of_workers,
                 "ExecutionProperty": {
-                    "MaxConcurrentRuns": 5,
+                    "MaxConcurrentRuns": max_concurrent_runs,
                 },
             },
         )
@@ -11,13 +11,14 @@
 #  the specific language governing permissions and limitations under the License.                                     #
 # #####################################################################################################################
 
-from typing import List
+from functools import wraps
+from typing import Dict, Sequence, Tuple
 
 import aws_cdk.aws_iam as iam
 from aws_cdk.aws_s3 import IBucket
 from aws_cdk import Fn, Aws, CfnResource
 
-S3_ALL_ACTIONS = [
+S3_ALL_ACTIONS = (
     "s3:GetObject",
     "s3:GetBucketLocation",
     "s3:ListBucket",
@@ -25,24 +26,89 @@ S3_ALL_ACTIONS = [
     "s3:ListMultipartUploadParts",
     "s3:PutObject",
     "s3:AbortMultipartUpload",
-    "s3:DeleteObject"
-]
+    "s3:DeleteObject",
+)
+LOGS_WRITE_ACTIONS = (
+    "logs:CreateLogGroup",
+    "logs:CreateLogStream",
+    "logs:PutLogEvents",
+)
+FORECAST_READ_ACTIONS = (
+    "forecast:DescribeAutoPredictor",
+    "forecast:DescribeDataset",
+    "forecast:DescribeDatasetGroup",
+    "forecast:DescribePredictor",
+    "forecast:ListDatasetImportJobs",
+    "forecast:ListForecastExportJobs",
+    "forecast:ListForecasts",
+    "forecast:ListPredictorBacktestExportJobs",
+    "forecast:ListPredictors",
+)
+GLUE_CATALOG_ACTIONS = (
+    "glue:GetDatabase",
+    "glue:GetTable",
+    "glue:GetPartitions",
+    "glue:DeleteTable",  # required to delete temporary tables
+    "glue:CreateTable",
+    "glue:BatchCreatePartition",
+    "glue:GetSecurityConfiguration",
+    "glue:GetSecurityConfigurations",
+    "glue:GetDataCatalogEncryptionSettings",
+)
+GLUE_ARN_PREFIX = f"arn:{Aws.PARTITION}:glue:{Aws.REGION}:{Aws.ACCOUNT_ID}"
+GLUE_JOBS_LOG_GROUP_ARN = f"arn:{Aws.PARTITION}:logs:{Aws.REGION}:{Aws.ACCOUNT_ID}:log-group:/aws-glue/jobs/*"
+
+
+def _s3_statement(resources: Sequence[str]) -> iam.PolicyStatement:
+    """Build the statement allowing S3_ALL_ACTIONS on resources"""
+    return iam.PolicyStatement(
+        effect=iam.Effect.ALLOW,
+        actions=list(S3_ALL_ACTIONS),
+        resources=list(resources),
+    )
+
+
+def _memoized(method):
+    """Memoize a GluePolicies method on its instance, so that the cached documents live only as long as it does"""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self._documents:
+            self._documents[key] = method(self, *args, **kwargs)
+        return self._documents[key]
+
+    return wrapper
 
 
 class GluePolicies:
-    def s3_read_write_access(self, buckets: List[IBucket]):
+    """
+    Policy documents for the AWS Glue ETL job role. Each document is built once per instance and set of arguments -
+    constructs are hashed by identity, so repeated calls with the same constructs return the same PolicyDocument
+    """
+
+    def __init__(self):
+        self._documents: Dict[Tuple, iam.PolicyDocument] = {}
+
+    def s3_read_write_access(self, buckets: Sequence[IBucket]):
+        return self._s3_read_write_access(tuple(buckets))
+
+    @_memoized
+    def _s3_read_write_access(self, buckets: Tuple[IBucket, ...]):
         return iam.PolicyDocument(
             statements=[
-                iam.PolicyStatement(
-                    effect=iam.Effect.ALLOW,
-                    actions=S3_ALL_ACTIONS,
-                    resources=[bucket.arn_for_objects("*") for bucket in buckets]
-                    + [bucket.bucket_arn for bucket in buckets],
+                _s3_statement(
+                    tuple(
+                        arn
+                        for bucket in buckets
+                        for arn in (bucket.bucket_arn, bucket.arn_for_objects("*"))
+                    )
                 )
             ]
         )
 
-    def s3_solutions_read_access(self):
+    @_memoized
+    def s3_solutions_read_access(self, source_bucket: str):
         return iam.PolicyDocument(
             statements=[
                 iam.PolicyStatement(
@@ -54,56 +120,42 @@ class GluePolicies:
                     resources=[
                         Fn.sub(
                             "arn:${AWS::Partition}:s3:::${bucket}-${AWS::Region}/*",
-                            variables={
-                                "bucket": Fn.find_in_map(
-                                    "SourceCode", "General", "S3Bucket"
-                                )
-                            },
+                            variables={"bucket": source_bucket},
                         ),
                         Fn.sub(
                             "arn:${AWS::Partition}:s3:::${bucket}-${AWS::Region}",
-                            variables={
-                                "bucket": Fn.find_in_map(
-                                    "SourceCode", "General", "S3Bucket"
-                                )
-                            },
+                            variables={"bucket": source_bucket},
                         ),
                     ],
                 )
             ]
         )
 
+    @_memoized
     def cloudwatch_logs_write(self):
         return iam.PolicyDocument(
             statements=[
                 iam.PolicyStatement(
                     effect=iam.Effect.ALLOW,
-                    actions=[
-                        "logs:CreateLogGroup",
-                        "logs:CreateLogStream",
-                        "logs:PutLogEvents",
-                    ],
-                    resources=[
-                        f"arn:{Aws.PARTITION}:logs:{Aws.REGION}:{Aws.ACCOUNT_ID}:log-group:/aws-glue/jobs/*"
-                    ],
+                    actions=list(LOGS_WRITE_ACTIONS),
+                    resources=[GLUE_JOBS_LOG_GROUP_ARN],
                 )
             ]
         )
 
+    @_memoized
     def forecast_read(self):
         return iam.PolicyDocument(
             statements=[
                 iam.PolicyStatement(
                     effect=iam.Effect.ALLOW,
-                    actions=[
-                        "forecast:Describe*",
-                        "forecast:List*",
-                    ],
+                    actions=list(FORECAST_READ_ACTIONS),
                     resources=["*"],
                 )
             ]
         )
 
+    @_memoized
     def glue_access(
         self,
         database: CfnResource,
@@ -114,39 +166,21 @@ class GluePolicies:
             statements=[
                 iam.PolicyStatement(
                     effect=iam.Effect.ALLOW,
-                    actions=[
-                        "glue:GetDatabase",
-                        "glue:GetTable",
-                        "glue:GetPartitions",
-                        "glue:DeleteTable",  # required to delete temporary tables
-                        "glue:CreateTable",
-                        "glue:BatchCreatePartition",
-                        "glue:GetSecurityConfiguration",
-                        "glue:GetSecurityConfigurations",
-                        "glue:GetDataCatalogEncryptionSettings",
-                    ],
+                    actions=list(GLUE_CATALOG_ACTIONS),
                     resources=[
-                        f"arn:{Aws.PARTITION}:glue:{Aws.REGION}:{Aws.ACCOUNT_ID}:catalog",
-                        f"arn:{Aws.PARTITION}:glue:{Aws.REGION}:{Aws.ACCOUNT_ID}:{database.ref}",
-                        f"arn:{Aws.PARTITION}:glue:{Aws.REGION}:{Aws.ACCOUNT_ID}:table/{database.ref}/*",
-                        f"arn:{Aws.PARTITION}:glue:{Aws.REGION}:{Aws.ACCOUNT_ID}:database/{database.ref}",
+                        f"{GLUE_ARN_PREFIX}:catalog",
+                        f"{GLUE_ARN_PREFIX}:{database.ref}",
+                        f"{GLUE_ARN_PREFIX}:table/{database.ref}/*",
+                        f"{GLUE_ARN_PREFIX}:database/{database.ref}",
                     ],
                 ),
-                iam.PolicyStatement(
-                    effect=iam.Effect.ALLOW,
-                    actions=S3_ALL_ACTIONS,
-                    resources=[
-                        athena_bucket.arn_for_objects("*"),
+                _s3_statement(
+                    (
                         athena_bucket.bucket_arn,
-                    ],
-                ),
-                iam.PolicyStatement(
-                    effect=iam.Effect.ALLOW,
-                    actions=S3_ALL_ACTIONS,
-                    resources=[
-                        data_bucket.arn_for_objects("*"),
+                        athena_bucket.arn_for_objects("*"),
                         data_bucket.bucket_arn,
-                    ],
+                        data_bucket.arn_for_objects("*"),
+                    )
                 ),
             ],
         )
@@ -11,6 +11,7 @@
 #  the specific language governing permissions and limitations under the License.                                     #
 # #####################################################################################################################
 from dataclasses import field, dataclass
+from functools import cached_property
 from typing import Optional
 
 import aws_cdk.aws_iam as iam
@@ -30,6 +31,13 @@ from aws_solutions.cdk.aws_lambda.cfn_custom_resources.url_downloader import (
 )
 from aws_solutions.cdk.stack import NestedSolutionStack
 
+DESTINATION_KEYS = {
+    "ForecastDefaults": "forecast-defaults.yaml",
+    "TTS": "train/{forecast_name}.csv",
+    "RTS": "train/{forecast_name}.related.csv",
+    "MD": "train/{forecast_name}.metadata.csv",
+}
+
 
 @dataclass
 class DownloaderParameterResource:
@@ -37,15 +45,20 @@ class DownloaderParameterResource:
     name: str
 
     parameter: CfnParameter = field(init=False, repr=False)
-    condition: CfnCondition = field(init=False, repr=False)
 
     def __post_init__(self):
-        condition_name = f"{self.name}Provided"
-
         self.parameter = CfnParameter(self.parent, self.name, default="")
-        self.condition = CfnCondition(
+
+    @cached_property
+    def value(self) -> str:
+        return self.parameter.value_as_string
+
+    @cached_property
+    def condition(self) -> CfnCondition:
+        """The {name}Provided condition - only created (and added to the template) when it is used"""
+        return CfnCondition(
             self.parent,
-            condition_name,
+            f"{self.name}Provided",
             expression=Fn.condition_not(Fn.condition_equals(self.parameter, "")),
         )
 
@@ -54,8 +67,8 @@ class DownloaderParameterResource:
 class DownloaderParameter:
     parent: Construct
     name: str
-    forecast_name: CfnParameter
-    destination: CfnParameter
+    forecast_name: str
+    destination_bucket_name: str
 
     url: DownloaderParameterResource = field(default=None, repr=False, init=False)
     scheme: DownloaderParameterResource = field(default=None, repr=False, init=False)
@@ -75,47 +88,28 @@ class DownloaderParameter:
             self.parent,
             f"{self.name}Downloader",
             destination=Location(
-                bucket_name=self.destination.value_as_string,
+                bucket_name=self.destination_bucket_name,
                 object_key=self.destination_key,
             ),
-            source_url=self.url.parameter.value_as_string,
-            source_bucket=self.bucket.parameter.value_as_string,
-            source_key=self.key.parameter.value_as_string,
-            scheme=self.scheme.parameter.value_as_string,
-        )
-
-        policy = iam.Policy(
-            self.parent,
-            f"{downloader.name}S3AccessPolicy",
-            document=iam.PolicyDocument(
-                statements=[
-                    iam.PolicyStatement(
-                        effect=iam.Effect.ALLOW,
-                        actions=["s3:GetObject"],
-                        resources=[
-                            f"arn:{Aws.PARTITION}:s3:::{self.bucket.parameter.value_as_string}/{self.key.parameter.value_as_string}"
-                        ],
-                    )
-                ]
-            ),
+            source_url=self.url.value,
+            source_bucket=self.bucket.value,
+            source_key=self.key.value,
+            scheme=self.scheme.value,
         )
-        policy.attach_to_role(downloader.function.role)
-        Aspects.of(policy).add(ConditionalResources(self.bucket.condition))
 
         return downloader
 
-    @property
+    @cached_property
+    def source_object_arn(self) -> str:
+        return f"arn:{Aws.PARTITION}:s3:::{self.bucket.value}/{self.key.value}"
+
+    @cached_property
     def destination_key(self) -> str:
-        if self.name == "ForecastDefaults":
-            return "forecast-defaults.yaml"
-        elif self.name == "TTS":
-            return f"train/{self.forecast_name.value_as_string}.csv"
-        elif self.name == "RTS":
-            return f"train/{self.forecast_name.value_as_string}.related.csv"
-        elif self.name == "MD":
-            return f"train/{self.forecast_name.value_as_string}.metadata.csv"
-        else:
+        try:
+            key = DESTINATION_KEYS[self.name]
+        except KeyError:
             raise ValueError(f"invalid downloader name: {self.name}")
+        return key.format(forecast_name=self.forecast_name)
 
 
 @dataclass
@@ -134,22 +128,59 @@ class Downloaders:
     md: Optional[DownloaderParameter] = field(default=None, repr=False, init=False)
 
     def __post_init__(self):
+        forecast_name = self.forecast_name.value_as_string
+        destination_bucket_name = self.destination.value_as_string
         self.forecast_defaults = DownloaderParameter(
-            self.parent, "ForecastDefaults", self.forecast_name, self.destination
+            self.parent, "ForecastDefaults", forecast_name, destination_bucket_name
         )
         self.tts = DownloaderParameter(
-            self.parent, "TTS", self.forecast_name, self.destination
+            self.parent, "TTS", forecast_name, destination_bucket_name
         )
         self.rts = DownloaderParameter(
-            self.parent, "RTS", self.forecast_name, self.destination
+            self.parent, "RTS", forecast_name, destination_bucket_name
         )
         self.md = DownloaderParameter(
-            self.parent, "MD", self.forecast_name, self.destination
+            self.parent, "MD", forecast_name, destination_bucket_name
+        )
+
+        # files written to train/ trigger the forecast workflow, which reads forecast-defaults.yaml - it must land
+        # first. The dataset downloads only depend on the defaults (not on each other) and run in parallel.
+        for dataset in (self.tts, self.rts, self.md):
+            dataset.downloader.node.add_dependency(self.forecast_defaults.downloader)
+
+        self._grant_source_access()
+
+    def _grant_source_access(self):
+        """The downloaders share one function - grant it read access to each S3 source provided in a single policy"""
+        downloaders = (self.forecast_defaults, self.tts, self.rts, self.md)
+        any_bucket_provided = CfnCondition(
+            self.parent,
+            "AnyBucketProvided",
+            expression=Fn.condition_or(*(d.bucket.condition for d in downloaders)),
         )
 
-        self.tts.downloader.node.add_dependency(self.forecast_defaults.downloader)
-        self.rts.downloader.node.add_dependency(self.forecast_defaults.downloader)
-        self.md.downloader.node.add_dependency(self.forecast_defaults.downloader)
+        policy = iam.Policy(
+            self.parent,
+            "UrlDownloaderS3AccessPolicy",
+            document=iam.PolicyDocument(
+                statements=[
+                    iam.PolicyStatement(
+                        effect=iam.Effect.ALLOW,
+                        actions=["s3:GetObject"],
+                        resources=[
+                            Fn.condition_if(
+                                d.bucket.condition.logical_id,
+                                d.source_object_arn,
+                                Aws.NO_VALUE,
+                            ).to_string()
+                            for d in downloaders
+                        ],
+                    )
+                ]
+            ),
+        )
+        policy.attach_to_role(self.tts.downloader.function.role)
+        Aspects.of(policy).add(ConditionalResources(any_bucket_provided))
 
 
 class Downloader(NestedSolutionStack):
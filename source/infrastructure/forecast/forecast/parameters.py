@@ -25,6 +25,10 @@ TTS_URL_DEFAULT = "s3://amazon-forecast-samples/automation_solution/demo-nyctaxi
 RTS_URL_DEFAULT = "s3://amazon-forecast-samples/automation_solution/demo-nyctaxi/nyctaxi_weather_auto.related.csv"
 MD_URL_DEFAULT = "s3://amazon-forecast-samples/automation_solution/demo-nyctaxi/nyctaxi_weather_auto.metadata.csv"
 CFN_RESOURCE_TYPE_URL_INFO = "Custom::UrlInfo"
+RE_HTTP_HTTPS_S3 = (
+    r"^https?://([-\w\.]+)+(:\d+)?(/([-\w/_\.]*(\?\S+)?)?)?$|^s3://(.*)/(.*)$"
+)
+RE_HTTP_HTTPS_S3_OR_BLANK = rf"{RE_HTTP_HTTPS_S3}|^$"
 
 
 class ParameterSection:
@@ -34,17 +38,76 @@ class ParameterSection:
     forecast_config = "Forecast Configuration"
     dataset_config = "Dataset Configuration"
     notification_configuration = "Notification Configuration"
+    etl_config = "ETL Configuration"
+
+
+# (Parameters attribute, label, section) in the order they are presented in the CloudFormation console
+PARAMETER_LABELS = (
+    ("email", "Email", ParameterSection.notification_configuration),
+    (
+        "notebook_deploy",
+        "Deploy Jupyter Notebook",
+        ParameterSection.visualization_config,
+    ),
+    (
+        "notebook_instance_type",
+        "Jupyter Notebook Instance Type",
+        ParameterSection.visualization_config,
+    ),
+    (
+        "notebook_volume_size",
+        "Jupyter Notebook Volume Size",
+        ParameterSection.visualization_config,
+    ),
+    (
+        "quicksight_analysis_owner",
+        "(Optional) Deploy QuickSight Dashboard",
+        ParameterSection.visualization_config,
+    ),
+    (
+        "forecast_kms_key_arn",
+        "(Optional) KMS key ARN used to encrypt Datasets and Predictors managed by Amazon Forecast",
+        ParameterSection.security_config,
+    ),
+    ("forecast_deploy", "Demo / Forecast Deployment", ParameterSection.forecast_config),
+    ("forecast_name", "(Optional) Forecast Name", ParameterSection.forecast_config),
+    (
+        "forecast_defaults_url",
+        "(Optional) Default forecast configuration file URL",
+        ParameterSection.forecast_config,
+    ),
+    ("tts_url", "(Optional) Target Time Series URL", ParameterSection.dataset_config),
+    ("rts_url", "(Optional) Related Time Series URL", ParameterSection.dataset_config),
+    ("md_url", "(Optional) Item Metadata URL", ParameterSection.dataset_config),
+    (
+        "glue_max_concurrent_runs",
+        "Glue ETL Job Maximum Concurrent Runs",
+        ParameterSection.etl_config,
+    ),
+    ("glue_worker_type", "Glue ETL Job Worker Type", ParameterSection.etl_config),
+    (
+        "glue_number_of_workers",
+        "Glue ETL Job Number of Workers",
+        ParameterSection.etl_config,
+    ),
+    (
+        "lambda_memory_size",
+        "Workflow Lambda Memory Size",
+        ParameterSection.deployment_config,
+    ),
+    (
+        "lambda_provisioned_concurrency",
+        "Workflow Lambda Provisioned Concurrency",
+        ParameterSection.deployment_config,
+    ),
+    ("lambda_log_level", "CloudWatch Log Level", ParameterSection.deployment_config),
+)
 
 
 class Parameters(Construct):
     def __init__(self, scope: SolutionStack, id: str):
         super().__init__(scope, id)
 
-        re_http_https_s3 = (
-            r"^https?://([-\w\.]+)+(:\d+)?(/([-\w/_\.]*(\?\S+)?)?)?$|^s3://(.*)/(.*)$"
-        )
-        re_http_https_s3_or_blank = r"^https?://([-\w\.]+)+(:\d+)?(/([-\w/_\.]*(\?\S+)?)?)?$|^s3://(.*)/(.*)$|^$"
-
         self.email = CfnParameter(
             scope,
             id="Email",
@@ -65,6 +128,26 @@ class Parameters(Construct):
             allowed_values=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
         )
 
+        self.lambda_memory_size = CfnParameter(
+            scope,
+            id="LambdaMemorySize",
+            type="Number",
+            description="Memory (MB) for the AWS Lambda functions that create Amazon Forecast resources and the Amazon QuickSight analysis (CPU is allocated in proportion to memory)",
+            default=1769,
+            min_value=128,
+            max_value=10240,
+        )
+
+        self.lambda_provisioned_concurrency = CfnParameter(
+            scope,
+            id="LambdaProvisionedConcurrency",
+            type="Number",
+            description="Provisioned concurrency for each of the AWS Lambda functions the workflow polls while Amazon Forecast resources are created (0 to disable)",
+            default=0,
+            min_value=0,
+            max_value=100,
+        )
+
         self.notebook_deploy = CfnParameter(
             scope,
             id="NotebookDeploy",
@@ -115,6 +198,37 @@ class Parameters(Construct):
             allowed_pattern="(^arn:.*:kms:.*:.*:key/.*$|^$)",
         )
 
+        self.glue_max_concurrent_runs = CfnParameter(
+            scope,
+            id="GlueMaxConcurrentRuns",
+            type="Number",
+            description="Maximum number of concurrent runs allowed for the AWS Glue ETL job",
+            default=30,
+            min_value=1,
+            max_value=1000,
+            constraint_description="Must be an integer between 1 and 1000",
+        )
+
+        self.glue_worker_type = CfnParameter(
+            scope,
+            id="GlueWorkerType",
+            type="String",
+            description="The type of predefined worker allocated when the AWS Glue ETL job runs",
+            default="G.1X",
+            allowed_values=["G.1X", "G.2X", "G.4X", "G.8X"],
+        )
+
+        self.glue_number_of_workers = CfnParameter(
+            scope,
+            id="GlueNumberOfWorkers",
+            type="Number",
+            description="The maximum number of workers allocated when the AWS Glue ETL job runs (auto scaling is enabled)",
+            default=10,
+            min_value=2,
+            max_value=100,
+            constraint_description="Must be an integer between 2 and 100",
+        )
+
         # Downloader / Demo Configuration
         self.forecast_deploy = CfnParameter(
             scope,
@@ -140,7 +254,7 @@ class Parameters(Construct):
             id="ForecastDefaultsUrl",
             type="String",
             description="URL (S3, HTTP or HTTPS) your forecast defaults file (usually named forecast-defaults.yaml)",
-            allowed_pattern=re_http_https_s3,
+            allowed_pattern=RE_HTTP_HTTPS_S3,
             default=FORECAST_CONFIG_DEFAULT,
             constraint_description="Must be a valid s3/http/https address",
         )
@@ -150,7 +264,7 @@ class Parameters(Construct):
             id="TargetTimeSeriesUrl",
             type="String",
             description="URL (S3, HTTP or HTTPS) for target time series data",
-            allowed_pattern=re_http_https_s3,
+            allowed_pattern=RE_HTTP_HTTPS_S3,
             default=TTS_URL_DEFAULT,
             constraint_description="Must be a valid s3/http/https address",
         )
@@ -160,7 +274,7 @@ class Parameters(Construct):
             id="RelatedTimeSeriesUrl",
             type="String",
             description="URL (S3, HTTP or HTTPS) for related time series data",
-            allowed_pattern=re_http_https_s3_or_blank,
+            allowed_pattern=RE_HTTP_HTTPS_S3_OR_BLANK,
             default=RTS_URL_DEFAULT,
             constraint_description="Must be a valid s3/http/https address or blank",
         )
@@ -170,71 +284,11 @@ class Parameters(Construct):
             id="MetadataUrl",
             type="String",
             description="URL (S3, HTTP or HTTPS) for item metadata",
-            allowed_pattern=re_http_https_s3_or_blank,
+            allowed_pattern=RE_HTTP_HTTPS_S3_OR_BLANK,
             default=MD_URL_DEFAULT,
             constraint_description="Must be a valid http/https address or blank",
         )
 
-        scope.solutions_template_options.add_parameter(
-            self.email, "Email", ParameterSection.notification_configuration
-        )
-        scope.solutions_template_options.add_parameter(
-            self.notebook_deploy,
-            "Deploy Jupyter Notebook",
-            ParameterSection.visualization_config,
-        )
-        scope.solutions_template_options.add_parameter(
-            self.notebook_instance_type,
-            "Jupyter Notebook Instance Type",
-            ParameterSection.visualization_config,
-        )
-        scope.solutions_template_options.add_parameter(
-            self.notebook_volume_size,
-            "Jupyter Notebook Volume Size",
-            ParameterSection.visualization_config,
-        )
-        scope.solutions_template_options.add_parameter(
-            self.quicksight_analysis_owner,
-            "(Optional) Deploy QuickSight Dashboard",
-            ParameterSection.visualization_config,
-        )
-        scope.solutions_template_options.add_parameter(
-            self.forecast_kms_key_arn,
-            "(Optional) KMS key ARN used to encrypt Datasets and Predictors managed by Amazon Forecast",
-            ParameterSection.security_config,
-        )
-        scope.solutions_template_options.add_parameter(
-            self.forecast_deploy,
-            "Demo / Forecast Deployment",
-            ParameterSection.forecast_config,
-        )
-        scope.solutions_template_options.add_parameter(
-            self.forecast_name,
-            "(Optional) Forecast Name",
-            ParameterSection.forecast_config,
-        )
-        scope.solutions_template_options.add_parameter(
-            self.forecast_defaults_url,
-            "(Optional) Default forecast configuration file URL",
-            ParameterSection.forecast_config,
-        )
-        scope.solutions_template_options.add_parameter(
-            self.tts_url,
-            "(Optional) Target Time Series URL",
-            ParameterSection.dataset_config,
-        )
-        scope.solutions_template_options.add_parameter(
-            self.rts_url,
-            "(Optional) Related Time Series URL",
-            ParameterSection.dataset_config,
-        )
-        scope.solutions_template_options.add_parameter(
-            self.md_url,
-            "(Optional) Item Metadata URL",
-            ParameterSection.dataset_config,
-        )
-        scope.solutions_template_options.add_parameter(
-            self.lambda_log_level,
-            "CloudWatch Log Level",
-            ParameterSection.deployment_config,
-        )
+        add_parameter = scope.solutions_template_options.add_parameter
+        for attr, label, section in PARAMETER_LABELS:
+            add_parameter(getattr(self, attr), label, section)
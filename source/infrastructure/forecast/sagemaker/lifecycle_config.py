@@ -22,6 +22,8 @@ import os
 import pwd
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 subprocess.check_call([sys.executable, "-m", "pip", "install", "boto3==1.26.83"])
 subprocess.check_call([sys.executable, "-m", "pip", "install", "botocore==1.29.85"])
@@ -48,7 +50,8 @@ sagemaker_cli = boto3.client("sagemaker", config=CLIENT_CONFIG)
 s3_cli = boto3.client("s3", config=CLIENT_CONFIG)
 
 
-def get_tag(name, is_base64=False):
+@lru_cache(maxsize=None)
+def get_tags():
     with open("/opt/ml/metadata/resource-metadata.json", "r") as instance_metadata:
         metadata = instance_metadata.read()
     notebook_instance_arn = json.loads(metadata).get("ResourceArn")
@@ -57,16 +60,11 @@ def get_tag(name, is_base64=False):
     notebook_instance_tags = sagemaker_cli.list_tags(
         ResourceArn=notebook_instance_arn
     ).get("Tags")
-    tag = next(
-        iter(
-            [
-                tag.get("Value")
-                for tag in notebook_instance_tags
-                if tag.get("Key") == name
-            ]
-        ),
-        None,
-    )
+    return {tag.get("Key"): tag.get("Value") for tag in notebook_instance_tags}
+
+
+def get_tag(name, is_base64=False):
+    tag = get_tags().get(name)
 
     if is_base64:
         tag = base64.b64decode(tag).decode("utf-8")
@@ -96,28 +94,36 @@ def restart_notebook_server():
         logging.error("Failed to restart Jupyter Server")
 
 
+def download_file(source_bucket, key, local_path):
+    logging.info("Downloading s3://%s/%s to %s" % (source_bucket, key, local_path))
+    s3_cli.download_file(source_bucket, key, local_path)
+
+
 def copy_files(
     source_bucket, source_prefix, destination, username="ec2-user", groupname="ec2-user"
 ):
-
+    downloads = []
     for notebook in NOTEBOOKS:
         key = f"{source_prefix}/{notebook}"
 
         local_path = os.path.join(
             destination, key.replace(source_prefix, "").strip("/")
         )
-
-        logging.info("Downloading s3://%s/%s to %s" % (source_bucket, key, local_path))
-        local_dir = os.path.dirname(local_path)
-        os.makedirs(local_dir, exist_ok=True)
-        response = s3_cli.get_object(Bucket=source_bucket, Key=key)
-
-        with open(local_path, "wb") as local_file:
-            local_file.write(response.get("Body").read())
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        downloads.append((key, local_path))
+
+    # notebooks are small - download them concurrently so that each does not wait on the last
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(download_file, source_bucket, key, local_path)
+            for key, local_path in downloads
+        ]
+        for future in futures:
+            future.result()
 
     try:
-        uid = pwd.getpwnam(username).pw_uid
-        gid = grp.getgrnam(groupname).gr_gid
+        pwd.getpwnam(username)
+        grp.getgrnam(groupname)
     except KeyError:
         return
 
@@ -128,8 +134,7 @@ def copy_files(
 
     for root, directories, files in os.walk(destination):
         for f in files:
-            os.chown(os.path.join(root, f), uid, gid)
-            os.chmod(local_path, mode=0o664) # NOSONAR - this is a safe permission.
+            os.chmod(os.path.join(root, f), mode=0o664) # NOSONAR - this is a safe permission.
 
 
 if __name__ == "__main__":
@@ -11,7 +11,7 @@
 #  the specific language governing permissions and limitations under the License.                                     #
 # #####################################################################################################################
 
-import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -25,19 +25,28 @@ from aws_cdk.aws_sagemaker import (
 )
 from aws_cdk import CfnTag, Fn, Aws, CfnCondition, Aspects
 
+from aws_solutions.cdk import mappings
 from aws_solutions.cdk.aspects import ConditionalResources
 from aws_solutions.cdk.cfn_nag import CfnNagSuppression, add_cfn_nag_suppressions
 from aws_solutions.cdk.utils import is_solution_build
 from forecast.sagemaker.policies import NotebookPolicies
 
-context = '","'.join(
-    [
+
+@lru_cache(maxsize=1)
+def notebook_context() -> str:
+    """The sample notebook names, formatted for the NOTEBOOKS context variable"""
+    return '","'.join(
         notebook.name
         for notebook in (
             Path(__file__).absolute().parents[3] / "notebook" / "samples" / "notebooks"
         ).glob("*.ipynb")
-    ]
-)
+    )
+
+
+@lru_cache(maxsize=1)
+def _lifecycle_config_code() -> str:
+    """The notebook instance lifecycle configuration script"""
+    return Path(__file__).with_name("lifecycle_config.py").read_text()
 
 
 class Notebook(Construct):
@@ -73,12 +82,7 @@ class Notebook(Construct):
         )
 
         # lifecycle configuration
-        lifecycle_config_path = os.path.join(
-            os.path.dirname(__file__), "lifecycle_config.py"
-        )
-        with open(lifecycle_config_path) as lifecycle_config:
-            lifecycle_config_code = lifecycle_config.read()
-
+        lifecycle_config_code = _lifecycle_config_code()
         lifecycle_config = CfnNotebookInstanceLifecycleConfig(self, "LifecycleConfig")
         lifecycle_config.add_property_override(
             "OnStart", [{"Content": {"Fn::Base64": lifecycle_config_code}}]
@@ -133,6 +137,7 @@ class Notebook(Construct):
                 destination_bucket=notebook_destination_bucket,
                 destination_key_prefix=notebook_destination_prefix,
                 sources=assets,
+                memory_limit=1024,  # matches the glue script deployment - both share one handler function
             )
 
         Aspects.of(self).add(ConditionalResources(create_notebook))
@@ -141,9 +146,7 @@ class Notebook(Construct):
         if is_solution_build(self):
             prefix = Fn.sub(
                 "${prefix}/notebooks",
-                variables={
-                    "prefix": Fn.find_in_map("SourceCode", "General", "KeyPrefix")
-                },
+                variables={"prefix": mappings.source_key_prefix()},
             )
         else:
             prefix = "notebooks"
@@ -154,7 +157,7 @@ class Notebook(Construct):
             notebook_source_bucket = Fn.sub(
                 "${bucket}-${region}",
                 variables={
-                    "bucket": Fn.find_in_map("SourceCode", "General", "S3Bucket"),
+                    "bucket": mappings.source_bucket(),
                     "region": Aws.REGION,
                 },
             )
@@ -19,6 +19,9 @@ from constructs import Construct
 from aws_cdk.aws_s3 import IBucket
 from aws_cdk import Fn, Aws
 
+from aws_solutions.cdk import mappings
+
+
 @dataclass
 class NotebookPolicies:
     owner: Construct
@@ -39,13 +42,17 @@ class NotebookPolicies:
                         "s3:AbortMultipartUpload",
                         "s3:DeleteObject",
                     ],
-                    resources=[bucket.arn_for_objects("*") for bucket in buckets]
-                    + [bucket.bucket_arn for bucket in buckets],
+                    resources=[
+                        arn
+                        for bucket in buckets
+                        for arn in (bucket.arn_for_objects("*"), bucket.bucket_arn)
+                    ],
                 )
             ]
         )
 
     def s3_solutions_access(self):
+        bucket = mappings.source_bucket()
         return iam.PolicyDocument(
             statements=[
                 iam.PolicyStatement(
@@ -58,19 +65,11 @@ class NotebookPolicies:
                     resources=[
                         Fn.sub(
                             "arn:${AWS::Partition}:s3:::${bucket}-${AWS::Region}/*",
-                            variables={
-                                "bucket": Fn.find_in_map(
-                                    "SourceCode", "General", "S3Bucket"
-                                )
-                            },
+                            variables={"bucket": bucket},
                         ),
                         Fn.sub(
                             "arn:${AWS::Partition}:s3:::${bucket}-${AWS::Region}",
-                            variables={
-                                "bucket": Fn.find_in_map(
-                                    "SourceCode", "General", "S3Bucket"
-                                )
-                            },
+                            variables={"bucket": bucket},
                         ),
                     ],
                 )
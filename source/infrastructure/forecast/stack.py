@@ -29,10 +29,10 @@ from aws_cdk.aws_stepfunctions import (
     Pass,
 )
 from constructs import Construct
-from aws_cdk.aws_stepfunctions_tasks import GlueStartJobRun
 from aws_cdk import (
     Fn,
     CfnCondition,
+    CfnParameter,
     Tags,
     Aspects,
     Duration,
@@ -45,10 +45,12 @@ from aws_solutions.cdk.aws_lambda.cfn_custom_resources.resource_name import Reso
 from aws_solutions.cdk.aws_lambda.cfn_custom_resources.url_helper import UrlHelper
 from aws_solutions.cdk.cfn_nag import (
     CfnNagSuppressAll,
+    CfnNagSuppressPath,
     CfnNagSuppression,
     add_cfn_nag_suppressions,
 )
 from aws_solutions.cdk.stack import SolutionStack
+from aws_solutions.cdk.stepfunctions.jitter import FullJitterGlueStartJobRun
 from forecast.aws_lambda.functions import (
     S3EventHandler,
     CreateDatasetGroup,
@@ -73,6 +75,10 @@ from forecast.forecast.downloader import Downloader
 from forecast.forecast.parameters import Parameters
 from forecast.sagemaker.notebook import Notebook
 
+SOURCE_PATH = Path(__file__).parents[2]
+GLUE_JOBS_PATH = SOURCE_PATH / "glue" / "jobs"
+NOTEBOOKS_PATH = SOURCE_PATH / "notebook" / "samples" / "notebooks"
+
 
 class ForecastStack(SolutionStack):
     def __init__(self, scope: Construct, construct_id: str, *args, **kwargs) -> None:
@@ -88,30 +94,25 @@ class ForecastStack(SolutionStack):
             "CreateNotebook",
             expression=Fn.condition_equals(self.parameters.notebook_deploy, "Yes"),
         )
-        email_provided = CfnCondition(
-            self,
-            "EmailProvided",
-            expression=Fn.condition_not(Fn.condition_equals(self.parameters.email, "")),
+        email_provided = self._provided_condition("EmailProvided", self.parameters.email)
+        create_analysis = self._provided_condition(
+            "CreateAnalysis", self.parameters.quicksight_analysis_owner
         )
-        create_analysis = CfnCondition(
-            self,
-            "CreateAnalysis",
-            expression=Fn.condition_not(
-                Fn.condition_equals(self.parameters.quicksight_analysis_owner, ""),
-            ),
-        )
-        forecast_kms_enabled = CfnCondition(
-            self,
-            "ForecastSseKmsEnabled",
-            expression=Fn.condition_not(
-                Fn.condition_equals(self.parameters.forecast_kms_key_arn, "")
-            ),
+        forecast_kms_enabled = self._provided_condition(
+            "ForecastSseKmsEnabled", self.parameters.forecast_kms_key_arn
         )
         create_forecast_cdn = CfnCondition(
             self,
             "CreateForecast",
             expression=Fn.condition_equals(self.parameters.forecast_deploy, "Yes"),
         )
+        provisioned_concurrency_enabled = CfnCondition(
+            self,
+            "LambdaProvisionedConcurrencyEnabled",
+            expression=Fn.condition_not(
+                Fn.condition_equals(self.parameters.lambda_provisioned_concurrency, 0)
+            ),
+        )
 
         # Buckets
         data_bucket_name_resource = ResourceName(
@@ -146,6 +147,7 @@ class ForecastStack(SolutionStack):
 
         # Lambda Functions
         default_timeout = Duration.minutes(3)
+        workflow_memory_size = self.parameters.lambda_memory_size.value_as_number
         solution_layer = ForecastSolutionLayer(self, "SolutionLayer")
         create_dataset_group = CreateDatasetGroup(
             self, "CreateDatasetGroup", layers=[solution_layer], timeout=default_timeout
@@ -155,24 +157,35 @@ class ForecastStack(SolutionStack):
             "CreateDatasetImportJob",
             layers=[solution_layer],
             timeout=default_timeout,
+            memory_size=workflow_memory_size,
         )
         create_predictor = CreatePredictor(
-            self, "CreatePredictor", layers=[solution_layer], timeout=default_timeout
+            self,
+            "CreatePredictor",
+            layers=[solution_layer],
+            timeout=default_timeout,
+            memory_size=workflow_memory_size,
         )
         create_forecast = CreateForecast(
-            self, "CreateForecast", layers=[solution_layer], timeout=default_timeout
+            self,
+            "CreateForecast",
+            layers=[solution_layer],
+            timeout=default_timeout,
+            memory_size=workflow_memory_size,
         )
         create_forecast_export = CreateForecastExport(
             self,
             "CreateForecastExport",
             layers=[solution_layer],
             timeout=default_timeout,
+            memory_size=workflow_memory_size,
         )
         create_predictor_backtest_export = CreatePredictorBacktestExport(
             self,
             "CreatePredictorBacktestExport",
             layers=[solution_layer],
             timeout=default_timeout,
+            memory_size=workflow_memory_size,
         )
         create_glue_table_name = CreateGlueTableName(
             self, "CreateGlueTableName", layers=[solution_layer]
@@ -182,8 +195,30 @@ class ForecastStack(SolutionStack):
             "CreateQuickSightAnalysis",
             layers=[solution_layer],
             timeout=Duration.minutes(15),
+            memory_size=workflow_memory_size,
         )
 
+        # the workflow polls these functions (ResourcePending retries) while Amazon Forecast resources are created
+        provisioned_concurrency = (
+            self.parameters.lambda_provisioned_concurrency.value_as_number
+        )
+        version_inputs = [
+            self.parameters.lambda_memory_size.value_as_string,
+            policy_factory.kms_key_arn,
+        ]
+        for polled_step in (
+            create_dataset_import_job,
+            create_predictor,
+            create_forecast,
+            create_forecast_export,
+            create_predictor_backtest_export,
+        ):
+            polled_step.add_provisioned_concurrency(
+                provisioned_concurrency,
+                condition=provisioned_concurrency_enabled,
+                version_inputs=version_inputs,
+            )
+
         notifications = Notifications(
             self,
             "SNS Notification",
@@ -217,7 +252,7 @@ class ForecastStack(SolutionStack):
             max_attempts=100,
             errors=["DatasetsImporting"],
         )
-        forecast_etl = GlueStartJobRun(
+        forecast_etl = FullJitterGlueStartJobRun(
             self,
             "Forecast ETL",
             glue_job_name=f"{Aws.STACK_NAME}-Forecast-ETL",
@@ -263,6 +298,8 @@ class ForecastStack(SolutionStack):
                             self,
                             "Create Forecasts",
                             items_path="$.DatasetGroupNames",
+                            # the per-dataset group outputs are not used after the map - don't collect them into the state
+                            result_path=JsonPath.DISCARD,
                             parameters={
                                 "bucket.$": "$.bucket",
                                 "dataset_file.$": "$.dataset_file",
@@ -276,6 +313,8 @@ class ForecastStack(SolutionStack):
                                     "Create Forecast",
                                     result_path="$.ForecastArn",
                                     max_attempts=100,
+                                    interval=Duration.seconds(60),
+                                    backoff_rate=1.02,
                                 )
                             ).next(
                                 Parallel(
@@ -289,6 +328,8 @@ class ForecastStack(SolutionStack):
                                         "Create Forecast Export",
                                         result_path="$.PredictorArn",  # NOSONAR (python:S1192) - string for clarity
                                         max_attempts=100,
+                                        interval=Duration.seconds(60),
+                                        backoff_rate=1.02,
                                     )
                                 )
                                 .branch(
@@ -297,6 +338,8 @@ class ForecastStack(SolutionStack):
                                         "Create Predictor Backtest Export",
                                         result_path="$.PredictorArn",  # NOSONAR (python:S1192) - string for clarity
                                         max_attempts=100,
+                                        interval=Duration.seconds(60),
+                                        backoff_rate=1.02,
                                     )
                                 )
                                 .next(
@@ -379,26 +422,20 @@ class ForecastStack(SolutionStack):
         )
 
         # Handle suppressions for the notification handler resource generated by CDK
-        bucket_notification_handler = self.node.try_find_child(
-            "BucketNotificationsHandler050a0587b7544547bf325f094a3db834"
-        )
-        bucket_notification_policy = (
-            bucket_notification_handler.node.find_child("Role")
-            .node.find_child("DefaultPolicy")
-            .node.find_child("Resource")
-        )
-        add_cfn_nag_suppressions(
-            bucket_notification_policy,
-            [
-                CfnNagSuppression(
-                    "W12",
-                    "bucket resource is '*' due to circular dependency with bucket and role creation at the same time",
-                ),        
-                CfnNagSuppression(
-                    "W76",
-                    "SPCM for IAM policy document is higher than 25"
-                )
-            ],
+        Aspects.of(self).add(
+            CfnNagSuppressPath(
+                [
+                    CfnNagSuppression(
+                        "W12",
+                        "bucket resource is '*' due to circular dependency with bucket and role creation at the same time",
+                    ),
+                    CfnNagSuppression(
+                        "W76", "SPCM for IAM policy document is higher than 25"
+                    ),
+                ],
+                resource_type="AWS::IAM::Policy",
+                id_prefix="BucketNotificationsHandler",
+            )
         )
 
         # ETL Components
@@ -408,7 +445,10 @@ class ForecastStack(SolutionStack):
             unique_name=data_bucket_name_resource.resource_id.to_string(),
             forecast_bucket=data_bucket,
             athena_bucket=athena_bucket,
-            glue_jobs_path=Path(__file__).parents[2] / "glue" / "jobs",
+            glue_jobs_path=GLUE_JOBS_PATH,
+            max_concurrent_runs=self.parameters.glue_max_concurrent_runs.value_as_number,
+            worker_type=self.parameters.glue_worker_type.value_as_string,
+            number_of_workers=self.parameters.glue_number_of_workers.value_as_number,
         )
         athena = Athena(self, "AthenaResources", athena_bucket=athena_bucket)
 
@@ -431,13 +471,12 @@ class ForecastStack(SolutionStack):
             athena_bucket=athena_bucket,
             data_bucket=data_bucket,
         )
-        data_bucket.grant_read(create_dataset_group.function)
-        data_bucket.grant_read(create_dataset_import_job.function)
-        data_bucket.grant_read(create_predictor.function)
-        data_bucket.grant_read_write(create_predictor_backtest_export.function)
-        data_bucket.grant_read(create_forecast.function)
-        data_bucket.grant_read_write(create_forecast_export.function)
-        data_bucket.grant_read(s3_event_handler)
+        policy_factory.grant_data_read(create_dataset_group.function)
+        policy_factory.grant_data_read(create_dataset_import_job.function)
+        policy_factory.grant_data_read(create_predictor.function)
+        policy_factory.grant_data_read_write(create_predictor_backtest_export.function)
+        policy_factory.grant_data_read(create_forecast.function)
+        policy_factory.grant_data_read_write(create_forecast_export.function)
 
         # Notebook
         Notebook(
@@ -446,10 +485,7 @@ class ForecastStack(SolutionStack):
             buckets=[data_bucket],
             instance_type=self.parameters.notebook_instance_type.value_as_string,
             instance_volume_size=self.parameters.notebook_volume_size.value_as_number,
-            notebook_path=Path(__file__).parents[2]
-            / "notebook"
-            / "samples"
-            / "notebooks",
+            notebook_path=NOTEBOOKS_PATH,
             notebook_destination_bucket=data_bucket,
             notebook_destination_prefix="notebooks",
             create_notebook=create_notebook,
@@ -543,21 +579,22 @@ class ForecastStack(SolutionStack):
         )
 
         # Outputs
-        CfnOutput(
-            self,
-            "ForecastBucketName",
-            value=data_bucket.bucket_name,
-            export_name=f"{Aws.STACK_NAME}-ForecastBucketName",
-        )
-        CfnOutput(
-            self,
-            "AthenaBucketName",
-            value=athena_bucket.bucket_name,
-            export_name=f"{Aws.STACK_NAME}-AthenaBucketName",
-        )
-        CfnOutput(
+        for output_id, output_value in (
+            ("ForecastBucketName", data_bucket.bucket_name),
+            ("AthenaBucketName", athena_bucket.bucket_name),
+            ("StepFunctionsName", state_machine.state_machine_name),
+        ):
+            CfnOutput(
+                self,
+                output_id,
+                value=output_value,
+                export_name=f"{Aws.STACK_NAME}-{output_id}",
+            )
+
+    def _provided_condition(self, id: str, parameter: CfnParameter) -> CfnCondition:
+        """Create a condition that is true when the parameter is not blank"""
+        return CfnCondition(
             self,
-            "StepFunctionsName",
-            value=state_machine.state_machine_name,
-            export_name=f"{Aws.STACK_NAME}-StepFunctionsName",
+            id,
+            expression=Fn.condition_not(Fn.condition_equals(parameter, "")),
         )
@@ -13,6 +13,7 @@
 
 import logging
 import os
+from functools import cached_property
 from typing import Dict, Optional
 
 logger = logging.getLogger("cdk-helper")
@@ -22,16 +23,26 @@ class TemplateSource:
     def __init__(self, solution_name: str, solution_version: str):
         self.solution_name = solution_name
         self.solution_version = solution_version
-        self.quicksight_enabled = os.environ.get("ENABLE_QUICKSIGHT", True)
+        self.quicksight_enabled = os.environ.get(
+            "ENABLE_QUICKSIGHT", "true"
+        ).lower() in ("1", "true", "yes")
         self.dist_account_id = os.environ.get("DIST_ACCOUNT_ID", None)
         self.dist_quicksight_namespace = os.environ.get(
             "DIST_QUICKSIGHT_NAMESPACE", None
         )
 
-    def _enabled(self):
-        return self.quicksight_enabled and self.solution_name and self.solution_version
+    def _enabled(self) -> bool:
+        return all(
+            [
+                self.quicksight_enabled,
+                self.solution_name,
+                self.solution_version,
+                self.dist_account_id,
+                self.dist_quicksight_namespace,
+            ]
+        )
 
-    @property
+    @cached_property
     def arn(self) -> Optional[str]:
         if self._enabled():
             quicksight_template_name = "_".join(
@@ -52,9 +63,6 @@ class TemplateSource:
             logger.info("QuickSight is not enabled")
             return None
 
-    @property
+    @cached_property
     def mappings(self) -> Dict:
-        if self._enabled():
-            return {"QuickSightSourceTemplateArn": self.arn}
-        else:
-            return {"QuickSightSourceTemplateArn": ""}
+        return {"QuickSightSourceTemplateArn": self.arn or ""}
@@ -16,12 +16,8 @@ from pathlib import Path
 
 import setuptools
 
-readme_path = Path(__file__).resolve().parent.parent.parent / "README.md"
-with open(readme_path) as fp:
-    long_description = fp.read()
-
 cdk_json_path = Path(__file__).resolve().parent / "cdk.json"
-cdk_json = json.loads(cdk_json_path.read_text())
+cdk_json = json.loads(cdk_json_path.read_bytes())
 VERSION = cdk_json["context"]["SOLUTION_VERSION"]
 
 
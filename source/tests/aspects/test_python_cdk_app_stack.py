@@ -39,7 +39,7 @@ def synth_template():
             "APPLICATION_TYPE": "AWS-Solutions",
             "VERSION": "1.4.0",
             "BUCKET_NAME": "test_bucket",
-            "NOTEBOOKS": forecast.sagemaker.notebook.context,
+            "NOTEBOOKS": forecast.sagemaker.notebook.notebook_context(),
         }
     )
 
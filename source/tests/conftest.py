@@ -12,15 +12,60 @@
 # #####################################################################################################################
 
 import os
+from pathlib import Path
 
+import aws_cdk as cdk
 import boto3
+import forecast.sagemaker.notebook
 import pytest
+import quicksight
 import yaml
+from aspects.app_registry import AppRegistry
+from aws_cdk.assertions import Template
+from aws_solutions.cdk import CDKSolution
+from forecast.stack import ForecastStack
 from moto import mock_s3
 
 
 CONFIG_FILE = "config_and_overrides.yaml"
 
+solution = CDKSolution(cdk_json_path=Path(__file__).parent.absolute() / "cdk.json")
+
+
+@pytest.fixture(scope="session")
+def synth_template():
+    """The synthesized forecast stack, shared by all tests that only inspect it"""
+    app = cdk.App(
+        context={
+            "SOLUTION_NAME": "Improving Forecast Accuracy with Machine Learning",
+            "SOLUTION_ID": "SO0123Test",
+            "SOLUTION_VERSION": "v1.5.6",
+            "APP_REG_NAME": "improving_forecast_accuracy_with_machine_learning",
+            "APPLICATION_TYPE": "AWS-Solutions",
+            "VERSION": "1.5.6",
+            "BUCKET_NAME": "test_bucket",
+            "NOTEBOOKS": forecast.sagemaker.notebook.notebook_context(),
+        }
+    )
+
+    stack = ForecastStack(
+        app,
+        "forecast-stack-cdk",
+        description="Automate Amazon Forecast predictor and forecast generation and visualize forecasts via Amazon "
+        + "QuickSight or an Amazon SageMaker Jupyter Notebook",
+        template_filename="improving-forecast-accuracy-with-machine-learning.template",
+        synthesizer=solution.synthesizer,
+        extra_mappings=quicksight.TemplateSource(
+            solution_name=app.node.try_get_context("SOLUTION_NAME"),
+            solution_version=app.node.try_get_context("SOLUTION_VERSION"),
+        ).mappings,
+    )
+
+    cdk.Aspects.of(app).add(AppRegistry(stack, "AppRegistryAspect"))
+    template = Template.from_stack(stack)
+
+    yield template, app
+
 
 @pytest.fixture(autouse=True)
 def aws_credentials():
@@ -28,6 +28,7 @@ ETL = pytest.importorskip("glue.jobs.forecast_etl").ETL
 ForecastDataTransformation = pytest.importorskip(
     "glue.jobs.forecast_etl"
 ).ForecastDataTransformation
+service_clients = pytest.importorskip("glue.jobs.forecast_etl")._service_clients
 
 from pyspark import SparkContext
 from pyspark.sql import DataFrame
@@ -187,6 +188,14 @@ def predictor_backtest_sample():
     return content
 
 
+@pytest.fixture(autouse=True)
+def reset_service_clients():
+    """boto3 clients are cached by the ETL job - clear them so each test sees its own mocks"""
+    service_clients.clear()
+    yield
+    service_clients.clear()
+
+
 @pytest.fixture(params=DOMAINS)
 def dataset_by_domain(request, mocker):
     dataset = mocker.MagicMock()
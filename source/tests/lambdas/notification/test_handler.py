@@ -82,6 +82,22 @@ def test_config_not_found(s3_event, mocker):
     )
 
 
+def test_config_missing_from_bucket(s3_missing_config, s3_event, mocker):
+    client_mock = mocker.MagicMock()
+    mocker.patch("lambdas.notification.handler.get_sfn_client", client_mock)
+    mocker.patch("lambdas.notification.handler.Config", Config)
+    s3_event["Records"][0]["s3"]["bucket"]["name"] = "testbucket"
+
+    handler.notification(s3_event, None)
+
+    # a missing forecast-defaults.yaml still starts the workflow, which reports the missing configuration
+    args, kwargs = client_mock().start_execution.call_args
+    assert (
+        json.loads(kwargs.get("input")).get("error").get("serviceError").get("Error")
+        == "ConfigNotFound"
+    )
+
+
 def test_config_problem(s3_event, mocker):
     client_mock = mocker.MagicMock()
     mocker.patch("lambdas.notification.handler.get_sfn_client", client_mock)
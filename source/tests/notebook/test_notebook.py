@@ -33,6 +33,7 @@ def lifecycle_config():
     os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
     import infrastructure.forecast.sagemaker.lifecycle_config as lifecycle_config
 
+    lifecycle_config.get_tags.cache_clear()
     yield lifecycle_config
     os.environ.pop("AWS_DEFAULT_REGION", None)
 
@@ -109,6 +110,31 @@ def test_get_tag_b64(lifecycle_config, mocker, forecast_stub):
     assert lifecycle_config.get_tag("tagname", is_base64=True) == "test"
 
 
+def test_get_tag_lists_tags_once(lifecycle_config, mocker, forecast_stub):
+    mocker.patch(
+        "infrastructure.forecast.sagemaker.lifecycle_config.open",
+        mocker.mock_open(read_data='{"ResourceArn": "arn::mocked"}'),
+    )
+    mocker.patch(
+        "infrastructure.forecast.sagemaker.lifecycle_config.sagemaker_cli",
+    )
+
+    lifecycle_config.sagemaker_cli = forecast_stub.client
+    forecast_stub.add_response(
+        "list_tags",
+        {
+            "Tags": [
+                {"Key": "tagname", "Value": "tagvalue"},
+                {"Key": "othertag", "Value": "dGVzdA=="},
+            ]
+        },
+    )
+
+    assert lifecycle_config.get_tag("tagname") == "tagvalue"
+    assert lifecycle_config.get_tag("othertag", is_base64=True) == "test"
+    forecast_stub.assert_no_pending_responses()
+
+
 def test_set_jupyter_env_from_tag(lifecycle_config, mocker):
     mock_open = mocker.mock_open()
     mocker.patch(
@@ -163,4 +189,6 @@ def test_copy_files(s3_valid_config, lifecycle_config, tmpdir):
     lifecycle_config.copy_files(
         "testbucket", "some", tmpdir.dirname, username=uid, groupname=gid
     )
-    assert os.path.isfile(os.path.join(tmpdir.dirname, "SampleVisualization.ipynb"))
+    notebook = os.path.join(tmpdir.dirname, "SampleVisualization.ipynb")
+    assert os.path.isfile(notebook)
+    assert os.stat(notebook).st_mode & 0o777 == 0o664
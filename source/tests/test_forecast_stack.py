@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+
+# #####################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                 #
+#                                                                                                                     #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance     #
+#  with the License. You may obtain a copy of the License at                                                          #
+#                                                                                                                     #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                        #
+#                                                                                                                     #
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed   #
+#  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for  #
+#  the specific language governing permissions and limitations under the License.                                     #
+# #####################################################################################################################
+
+from aws_cdk.assertions import Match
+
+
+def test_s3_event_handler_train_read(synth_template):
+    template, _ = synth_template
+    template.has_resource_properties(
+        "AWS::IAM::ManagedPolicy",
+        {
+            "PolicyDocument": {
+                "Statement": [
+                    {
+                        "Action": "s3:GetObject",
+                        "Effect": "Allow",
+                        "Resource": [
+                            {
+                                "Fn::Join": [
+                                    "",
+                                    [
+                                        {"Fn::GetAtt": ["ForecastBucket", "Arn"]},
+                                        "/train/*",
+                                    ],
+                                ]
+                            },
+                            {
+                                "Fn::Join": [
+                                    "",
+                                    [
+                                        {"Fn::GetAtt": ["ForecastBucket", "Arn"]},
+                                        "/forecast-defaults.yaml",
+                                    ],
+                                ]
+                            },
+                        ],
+                    },
+                    {
+                        "Action": "s3:ListBucket",
+                        "Effect": "Allow",
+                        "Resource": {"Fn::GetAtt": ["ForecastBucket", "Arn"]},
+                    },
+                ],
+            }
+        },
+    )
+
+
+def test_s3_event_handler_has_no_bucket_wide_read(synth_template):
+    template, app = synth_template
+    stack = app.node.find_child("forecast-stack-cdk")
+    role_id = stack.resolve(stack.node.find_child("S3EventHandler-Role").role_name)
+    role_ref = {"Ref": role_id["Ref"]}
+
+    bucket_wide = {"Fn::Join": ["", [{"Fn::GetAtt": ["ForecastBucket", "Arn"]}, "/*"]]}
+    bucket = {"Fn::GetAtt": ["ForecastBucket", "Arn"]}
+
+    policies = {
+        **template.find_resources("AWS::IAM::Policy"),
+        **template.find_resources("AWS::IAM::ManagedPolicy"),
+    }
+    role_policies = [
+        policy
+        for policy in policies.values()
+        if role_ref in policy["Properties"].get("Roles", [])
+    ]
+    managed_arns = template.find_resources("AWS::IAM::Role")[role_id["Ref"]][
+        "Properties"
+    ].get("ManagedPolicyArns", [])
+    role_policies.extend(
+        policies[arn["Ref"]] for arn in managed_arns if arn.get("Ref") in policies
+    )
+    assert role_policies
+
+    for policy in role_policies:
+        for statement in policy["Properties"]["PolicyDocument"]["Statement"]:
+            actions = statement["Action"]
+            actions = actions if isinstance(actions, list) else [actions]
+            resources = statement["Resource"]
+            resources = resources if isinstance(resources, list) else [resources]
+            if any(a.startswith(("s3:GetObject", "s3:List")) for a in actions):
+                assert bucket_wide not in resources
+                # listing is needed so that a missing forecast-defaults.yaml is reported as NoSuchKey
+                if bucket in resources:
+                    assert actions == ["s3:ListBucket"]
+
+
+def test_glue_job_parameters(synth_template):
+    template, _ = synth_template
+    template.has_parameter(
+        "GlueMaxConcurrentRuns",
+        {"Type": "Number", "Default": 30, "MinValue": 1, "MaxValue": 1000},
+    )
+    template.has_parameter("GlueWorkerType", {"Type": "String", "Default": "G.1X"})
+    template.has_parameter("GlueNumberOfWorkers", {"Type": "Number", "Default": 10})
+    template.has_resource_properties(
+        "AWS::Glue::Job",
+        {
+            "ExecutionProperty": {
+                "MaxConcurrentRuns": {"Ref": "GlueMaxConcurrentRuns"}
+            },
+            "WorkerType": {"Ref": "GlueWorkerType"},
+            "NumberOfWorkers": {"Ref": "GlueNumberOfWorkers"},
+        },
+    )
+
+
+def test_glue_job_spark_ui(synth_template):
+    template, _ = synth_template
+    template.has_resource_properties(
+        "AWS::Glue::Job",
+        {
+            "DefaultArguments": Match.object_like(
+                {
+                    "--additional-python-modules": "boto3==1.26.83",
+                    "--enable-spark-ui": "true",
+                }
+            )
+        },
+    )
+    template.has_resource_properties(
+        "AWS::S3::Bucket",
+        {
+            "LifecycleConfiguration": {
+                "Rules": Match.array_with(
+                    [
+                        {
+                            "ExpirationInDays": 30,
+                            "Prefix": "glue/spark-event-logs/",
+                            "Status": "Enabled",
+                        }
+                    ]
+                )
+            }
+        },
+    )
+
+
+def test_forecast_etl_retry_jitter(synth_template):
+    template, _ = synth_template
+    state_machines = template.find_resources("AWS::StepFunctions::StateMachine")
+    assert len(state_machines) == 1
+
+    definition = "".join(
+        part
+        for part in next(iter(state_machines.values()))["Properties"][
+            "DefinitionString"
+        ]["Fn::Join"][1]
+        if isinstance(part, str)
+    )
+    assert (
+        '"Retry":[{"ErrorEquals":["Glue.ConcurrentRunsExceededException"],"IntervalSeconds":120,"MaxAttempts":100,"BackoffRate":1.02,"JitterStrategy":"FULL"}]'
+        in definition
+    )
+
+
+def test_polled_functions_provisioned_concurrency(synth_template):
+    template, _ = synth_template
+    template.has_parameter(
+        "LambdaProvisionedConcurrency", {"Type": "Number", "Default": 0}
+    )
+
+    aliases = template.find_resources(
+        "AWS::Lambda::Alias",
+        {
+            "Properties": {
+                "Name": "live",
+                "ProvisionedConcurrencyConfig": {
+                    "Fn::If": [
+                        "LambdaProvisionedConcurrencyEnabled",
+                        {
+                            "ProvisionedConcurrentExecutions": {
+                                "Ref": "LambdaProvisionedConcurrency"
+                            }
+                        },
+                        {"Ref": "AWS::NoValue"},
+                    ]
+                },
+            }
+        },
+    )
+    assert len(aliases) == 5
+    template.resource_count_is("AWS::Lambda::Version", 5)
+
+
+def test_workflow_memory_size(synth_template):
+    template, _ = synth_template
+    template.has_parameter("LambdaMemorySize", {"Type": "Number", "Default": 1769})
+    functions = template.find_resources(
+        "AWS::Lambda::Function",
+        {"Properties": {"MemorySize": {"Ref": "LambdaMemorySize"}}},
+    )
+    assert len(functions) == 6
+
+    # polled functions publish a new version when parameters used in their configuration change
+    template.all_resources_properties(
+        "AWS::Lambda::Version",
+        {
+            "Description": {
+                "Fn::Join": [
+                    " ",
+                    [{"Ref": "LambdaMemorySize"}, {"Ref": "ForecastKmsKeyArn"}],
+                ]
+            }
+        },
+    )
+
+
+def test_workflow_shared_policies(synth_template):
+    template, _ = synth_template
+    forecast_access = template.find_resources(
+        "AWS::IAM::Policy",
+        {
+            "Properties": {
+                "PolicyDocument": {
+                    "Statement": [
+                        Match.object_like(
+                            {"Action": Match.array_with(["forecast:Create*"])}
+                        )
+                    ]
+                }
+            }
+        },
+    )
+    assert len(forecast_access) == 1
+    (policy,) = forecast_access.values()
+    assert len(policy["Properties"]["Roles"]) == 7
+
+
+def test_bucket_notifications_handler_suppressions(synth_template):
+    template, _ = synth_template
+    policies = template.find_resources(
+        "AWS::IAM::Policy",
+        {
+            "Metadata": {
+                "cfn_nag": {
+                    "rules_to_suppress": Match.array_with(
+                        [Match.object_like({"id": "W76"})]
+                    )
+                }
+            }
+        },
+    )
+    assert any(
+        logical_id.startswith("BucketNotificationsHandler") for logical_id in policies
+    )
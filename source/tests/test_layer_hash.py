@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+# #####################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                 #
+#                                                                                                                     #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance     #
+#  with the License. You may obtain a copy of the License at                                                          #
+#                                                                                                                     #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                        #
+#                                                                                                                     #
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed   #
+#  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for  #
+#  the specific language governing permissions and limitations under the License.                                     #
+# #####################################################################################################################
+
+import aws_cdk as cdk
+import pytest
+from aws_cdk.assertions import Template
+from aws_solutions.cdk.aws_lambda.python.layer import SolutionsPythonLayerVersion
+
+
+@pytest.fixture
+def layer_with_local_requirement(tmp_path):
+    package = tmp_path / "package"
+    (package / "local_lib").mkdir(parents=True)
+    (package / "local_lib" / "__init__.py").write_text("VALUE = 1\n")
+    (package / "setup.py").write_text(
+        "from setuptools import setup\n"
+        "setup(name='local_lib', version='1.0.0', packages=['local_lib'])\n"
+    )
+
+    requirements = tmp_path / "requirements"
+    requirements.mkdir()
+    (requirements / "requirements.txt").write_text("../package\n")
+    return requirements, package
+
+
+def layer_asset_key(requirements) -> str:
+    stack = cdk.Stack(cdk.App(), "LayerStack")
+    SolutionsPythonLayerVersion(stack, "Layer", requirements_path=requirements)
+    layers = Template.from_stack(stack).find_resources("AWS::Lambda::LayerVersion")
+    return next(iter(layers.values()))["Properties"]["Content"]["S3Key"]
+
+
+def test_layer_hash_stable_across_synths(layer_with_local_requirement):
+    requirements, package = layer_with_local_requirement
+
+    # the first synth bundles the local requirement, which leaves build output in its source tree
+    first = layer_asset_key(requirements)
+    assert (package / "build").is_dir()
+    (package / "local_lib" / "__pycache__").mkdir()
+    (package / "local_lib" / "__pycache__" / "__init__.cpython-39.pyc").write_bytes(b"\0")
+
+    assert layer_asset_key(requirements) == first
+
+
+def test_layer_hash_tracks_local_requirement(layer_with_local_requirement):
+    requirements, package = layer_with_local_requirement
+
+    first = layer_asset_key(requirements)
+    (package / "local_lib" / "__init__.py").write_text("VALUE = 2\n")
+
+    assert layer_asset_key(requirements) != first
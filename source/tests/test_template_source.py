@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+# #####################################################################################################################
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.                                                 #
+#                                                                                                                     #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance     #
+#  with the License. You may obtain a copy of the License at                                                          #
+#                                                                                                                     #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                        #
+#                                                                                                                     #
+#  Unless required by applicable law or agreed to in writing, software distributed under the License is distributed   #
+#  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for  #
+#  the specific language governing permissions and limitations under the License.                                     #
+# #####################################################################################################################
+
+import pytest
+from quicksight import TemplateSource
+
+
+@pytest.fixture
+def dist_env(monkeypatch):
+    monkeypatch.setenv("DIST_ACCOUNT_ID", "111122223333")
+    monkeypatch.setenv("DIST_QUICKSIGHT_NAMESPACE", "namespace")
+    monkeypatch.delenv("ENABLE_QUICKSIGHT", raising=False)
+    yield monkeypatch
+
+
+def test_template_source_enabled(dist_env):
+    source = TemplateSource(solution_name="solution", solution_version="v1.0.0")
+    assert (
+        source.arn
+        == "arn:aws:quicksight:us-east-1:111122223333:template/namespace_solution_v1_0_0"
+    )
+    assert source.mappings == {"QuickSightSourceTemplateArn": source.arn}
+
+
+@pytest.mark.parametrize("value", ["false", "False", "0", "no"])
+def test_template_source_disabled(dist_env, value):
+    dist_env.setenv("ENABLE_QUICKSIGHT", value)
+    source = TemplateSource(solution_name="solution", solution_version="v1.0.0")
+    assert not source.arn
+    assert source.mappings == {"QuickSightSourceTemplateArn": ""}
+
+
+@pytest.mark.parametrize("name", ["DIST_ACCOUNT_ID", "DIST_QUICKSIGHT_NAMESPACE"])
+def test_template_source_distribution_required(dist_env, name):
+    dist_env.delenv(name)
+    source = TemplateSource(solution_name="solution", solution_version="v1.0.0")
+    assert not source.arn
+    assert source.mappings == {"QuickSightSourceTemplateArn": ""}